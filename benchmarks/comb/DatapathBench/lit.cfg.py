@@ -14,6 +14,9 @@ if parent_config.exists():
 else:
     raise FileNotFoundError(f"Parent config not found: {parent_config}")
 
+# The parent config puts the project sources on sys.path
+from circt_synth_tracker.lit_common import suite_exec_root
+
 # name: The name of this test suite.
 config.name = 'DatapathBench'
 
@@ -31,18 +34,9 @@ config.excludes = ['DatapathBench']
 config.test_source_root = os.path.dirname(__file__)
 
 # test_exec_root: The root path where tests should be run.
-# Inherit test_output_dir from parent config
-test_output_dir = getattr(config, 'test_output_dir', 'test-output')
-
-# Calculate relative path from benchmarks directory to this test suite
-benchmarks_root = Path(__file__).parent.parent.parent  # Points to benchmarks/
-relative_path = Path(__file__).parent.relative_to(benchmarks_root)  # Gets comb/DatapathBench
-
-bw = lit_config.params.get('BW', '16')
-config.test_exec_root = os.path.join(benchmarks_root.parent, test_output_dir, str(relative_path), bw)
-
-# Ensure output directory exists
-os.makedirs(config.test_exec_root, exist_ok=True)
+# Mirrors this suite's path under the output directory inherited from the
+# parent config, e.g. build/comb/DatapathBench/<BW>
+config.test_exec_root = suite_exec_root(config, lit_config, os.path.dirname(__file__))
 
 # Note: Substitutions like %SYNTH_TOOL, %BW, %judge, %submit are inherited
 # from benchmarks/lit.cfg.py via lit_config.load_config()
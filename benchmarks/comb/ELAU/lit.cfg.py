@@ -14,6 +14,9 @@ if parent_config.exists():
 else:
     raise FileNotFoundError(f"Parent config not found: {parent_config}")
 
+# The parent config puts the project sources on sys.path
+from circt_synth_tracker.lit_common import suite_exec_root
+
 # name: The name of this test suite.
 config.name = 'ELAU'
 
@@ -31,18 +34,10 @@ config.excludes = ['ELAU']
 config.test_source_root = os.path.dirname(__file__)
 
 # test_exec_root: The root path where tests should be run.
-# Inherit test_output_dir from parent config
-test_output_dir = getattr(config, 'test_output_dir', 'test-output')
-
-# Calculate relative path from benchmarks directory to this test suite
-benchmarks_root = Path(__file__).parent.parent.parent  # Points to benchmarks/
-relative_path = Path(__file__).parent.relative_to(benchmarks_root)  # Gets comb/ELAU
-
-bw = lit_config.params.get('BW', '16')
-config.test_exec_root = os.path.join(benchmarks_root.parent, test_output_dir, str(relative_path), bw)
+# Mirrors this suite's path under the output directory inherited from the
+# parent config, e.g. build/comb/ELAU/<BW>
+config.test_exec_root = suite_exec_root(config, lit_config, os.path.dirname(__file__))
 
-# Ensure output directory exists
-os.makedirs(config.test_exec_root, exist_ok=True)
 # Add substitutions for the ELAU src directory
 ealu_src_dir = Path(__file__).parent / 'ELAU' / 'src'
 config.substitutions.append(('%ELAU_SRC', str(ealu_src_dir))) 
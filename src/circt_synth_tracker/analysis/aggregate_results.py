@@ -8,11 +8,256 @@ Usage:
 """
 
 import argparse
-import json
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+from circt_synth_tracker.analysis.json_io import dumps, load_json, loads
+
+
+def _walk_json_files(root):
+    """Yield (parent_parts, path) for every ``*.json`` file below *root*.
+
+    Uses os.scandir so files and directories are told apart from the cached
+    directory entry type rather than an extra stat per entry. Like
+    ``Path.glob("**")``, symlinked directories are not descended into.
+    """
+    stack = [((), os.fspath(root))]
+    while stack:
+        parts, directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            # A missing root is the caller's error; a subdirectory removed
+            # during the walk is skipped like an unreadable one.
+            if not parts:
+                raise
+            continue
+        except (NotADirectoryError, PermissionError):
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((parts + (entry.name,), entry.path))
+            elif entry.name.endswith(".json"):
+                yield parts, entry.path
+
+
+def _matches_tool(parts, tool):
+    """Return True if a file's parent *parts* end with ``results/<tool>``."""
+    return len(parts) >= 2 and parts[-2] == "results" and fnmatchcase(parts[-1], tool)
+
+
+def _find_json_files(root, tool=None):
+    """Return sorted JSON files below *root*.
+
+    With *tool*, only files matching ``**/results/<tool>/*.json`` are
+    returned; *tool* may be a glob pattern (e.g. ``circt-*-pass``).
+    """
+    return sorted(
+        Path(path)
+        for parts, path in _walk_json_files(root)
+        if tool is None or _matches_tool(parts, tool)
+    )
+
+
+def _find_result_files(root, tool):
+    """Return (files, matched) from a single walk of *root*.
+
+    *files* are the ``**/results/<tool>/*.json`` files when there are any
+    (matched is True); otherwise every JSON file below *root* is returned so
+    the caller can fall back without walking the tree a second time.
+    """
+    found = list(_walk_json_files(root))
+    matched = sorted(Path(path) for parts, path in found if _matches_tool(parts, tool))
+    if matched:
+        return matched, True
+    return sorted(Path(path) for _, path in found), False
+
+
+def _read_result(json_file):
+    """Read one result file, returning (contents, error) instead of raising."""
+    try:
+        return json_file.read_bytes(), None
+    except OSError as e:
+        return None, e
+
+
+def _parse_results(raw):
+    """Parse (contents, error) pairs into (data, error) pairs.
+
+    All readable files are parsed with a single decoder call over one
+    concatenated array, which avoids per-document decoder setup. If that
+    fails, or a file does not hold exactly one document, each file is parsed
+    on its own so the error is reported against the file that caused it.
+    """
+    contents = [data for data, error in raw if error is None]
+    try:
+        docs = loads(b"[" + b",".join(contents) + b"]")
+    except ValueError:
+        docs = None
+    if docs is None or len(docs) != len(contents):
+        docs = []
+        for data in contents:
+            try:
+                docs.append((loads(data), None))
+            except ValueError as e:
+                docs.append((None, e))
+    else:
+        docs = [(doc, None) for doc in docs]
+
+    it = iter(docs)
+    return [next(it) if error is None else (None, error) for _, error in raw]
+
+
+def _load_result(json_file, data):
+    """Build one result from parsed *data* and merge its LEC/TV sidecars.
+
+    Returns (benchmark_name, metrics).
+    """
+    # Every result file repeats the same metric keys, and benchmark names
+    # recur across tools; intern them so the summary shares one copy each.
+    benchmark_name = data.get("benchmark", json_file.stem)
+    if isinstance(benchmark_name, str):
+        benchmark_name = sys.intern(benchmark_name)
+    metrics = {sys.intern(k): v for k, v in data.get("metrics", {}).items()}
+    # Preserve category if available (from submit.py)
+    if "category" in data:
+        metrics["category"] = data["category"]
+
+    # Merge LEC sidecar if present (<aig>.lec next to AIG file).
+    # Also handle the case where ABC optimization added an intermediate
+    # suffix (e.g. foo.opt.aig -> sidecar is foo.aig.lec).
+    aig_path = metrics.get("filename")
+    if aig_path:
+        p = Path(aig_path)
+        candidates = [Path(aig_path + ".lec")]
+        # Strip one intermediate extension: foo.opt.aig -> foo.aig.lec
+        inner = p.stem  # e.g. "foo.opt"
+        if "." in inner:
+            base = inner.rsplit(".", 1)[0]  # "foo"
+            candidates.append(p.parent / (base + p.suffix + ".lec"))
+        for lec_sidecar in candidates:
+            if lec_sidecar.exists():
+                try:
+                    lec_data = load_json(lec_sidecar)
+                    metrics.update(lec_data)
+                except Exception:
+                    pass
+                break
+
+    # Merge TV (translation validation) sidecar if present (<aig>.tv).
+    if aig_path:
+        tv_candidates = [Path(aig_path + ".tv")]
+        inner = Path(aig_path).stem
+        if "." in inner:
+            base = inner.rsplit(".", 1)[0]
+            tv_candidates.append(
+                Path(aig_path).parent / (base + Path(aig_path).suffix + ".tv")
+            )
+        for tv_sidecar in tv_candidates:
+            if tv_sidecar.exists():
+                try:
+                    tv_data = load_json(tv_sidecar)
+                    if "tv_status" in tv_data:
+                        metrics["tv_status"] = tv_data["tv_status"]
+                    tv_results = tv_data.get("tv_results", [])
+                    if tv_results:
+                        metrics["tv_total"] = len(tv_results)
+                        metrics["tv_verified"] = sum(
+                            1 for r in tv_results if r.get("status") == "equiv"
+                        )
+                        metrics["tv_results"] = tv_results
+                except Exception:
+                    pass
+                break
+
+    return benchmark_name, metrics
+
+
+def _try_load_result(json_file, parsed):
+    """Run _load_result, returning (json_file, result, error) instead of raising."""
+    data, error = parsed
+    if error is not None:
+        return json_file, None, error
+    try:
+        return json_file, _load_result(json_file, data), None
+    except Exception as e:
+        return json_file, None, e
+
+
+def _keyed_results(loaded, warnings, verbose_log=None):
+    """Yield (key, metrics) for each loaded result.
+
+    Keys are ``<benchmark>@<mode>`` when a mode is recorded, with a numeric
+    suffix added on (unexpected) collisions. Failures are written to the
+    *warnings* buffer and, if given, per-result details to *verbose_log*, so
+    the caller can emit each with a single write.
+    """
+    seen = set()
+    for json_file, result, error in loaded:
+        if error is not None:
+            warnings.write(f"Warning: Failed to process {json_file}: {error}\n")
+            continue
+
+        benchmark_name, metrics = result
+        mode = metrics.get("mode")
+        key = f"{benchmark_name}@{mode}" if mode else benchmark_name
+        # If still collides (unexpected), add a numeric suffix.
+        suffix = 2
+        while key in seen:
+            key = f"{benchmark_name}@{mode or 'dup'}#{suffix}"
+            suffix += 1
+        seen.add(key)
+
+        if verbose_log is not None:
+            verbose_log.write(f"  Processed: {key}\n    Metrics: {metrics}\n")
+
+        yield key, metrics
+
+
+def _write_summary(output_path, header, results, pretty=False):
+    """Stream a summary JSON to *output_path*.
+
+    Each (key, metrics) pair from *results* is serialized and written as it
+    is produced, so the full benchmarks mapping is never built. The count
+    is written last as ``total_benchmarks`` and also returned. With
+    *pretty*, the output is indented by 2 spaces per level.
+    """
+    if pretty:
+        # Reopen the header object to append the benchmarks mapping.
+        head = dumps(header, indent=True)[:-2] + b',\n  "benchmarks": {'
+        tail = b',\n  "total_benchmarks": %d\n}'
+
+        def entry(key, metrics):
+            value = dumps(metrics, indent=True).replace(b"\n", b"\n    ")
+            return b"\n    " + dumps(key) + b": " + value
+
+    else:
+        head = dumps(header)[:-1] + b',"benchmarks":{'
+        tail = b',"total_benchmarks":%d}'
+
+        def entry(key, metrics):
+            return dumps(key) + b":" + dumps(metrics)
+
+    count = 0
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(head)
+        for key, metrics in results:
+            if count:
+                f.write(b",")
+            if not isinstance(key, str):
+                key = str(key)
+            f.write(entry(key, metrics))
+            count += 1
+        f.write(b"\n  }" if pretty and count else b"}")
+        f.write(tail % count)
+    return count
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -31,13 +276,29 @@ def main():
     parser.add_argument(
         "-o", "--output", help="Output JSON file (default: <tool>-summary.json)"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of result files to load in parallel (default: number of available CPU cores)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the summary JSON for human inspection (default: compact)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
 
     results_dir = Path(args.results_dir)
 
-    if not results_dir.exists():
+    # Search for results in 'results' subdirectories; a missing results
+    # directory surfaces here rather than through a separate exists() check.
+    try:
+        json_files, matched = _find_result_files(results_dir, args.tool)
+    except FileNotFoundError:
         print(f"Error: Results directory not found: {results_dir}", file=sys.stderr)
         return 1
 
@@ -51,118 +312,40 @@ def main():
     print(f"Results directory: {results_dir}")
     print(f"Output file: {output_path}")
 
-    # Collect all JSON result files
-    results = {}
-
-    # Search for results in 'results' subdirectories
-    json_files = list(results_dir.glob(f"**/results/{args.tool}/*.json"))
-
-    if not json_files:
+    if not matched:
         print(
             f"Warning: No JSON files found in {results_dir}/**/results/",
             file=sys.stderr,
         )
         print("Trying to find all JSON files...", file=sys.stderr)
-        json_files = list(results_dir.glob("**/*.json"))
 
     if not json_files:
         print(f"Warning: No JSON files found in {results_dir}", file=sys.stderr)
 
-    for json_file in json_files:
-        try:
-            with open(json_file, "r") as f:
-                data = json.load(f)
-                benchmark_name = data.get("benchmark", json_file.stem)
-                metrics = data.get("metrics", {})
-                # Preserve category if available (from submit.py)
-                if "category" in data:
-                    metrics["category"] = data["category"]
-
-                # Merge LEC sidecar if present (<aig>.lec next to AIG file).
-                # Also handle the case where ABC optimization added an intermediate
-                # suffix (e.g. foo.opt.aig -> sidecar is foo.aig.lec).
-                aig_path = metrics.get("filename")
-                if aig_path:
-                    p = Path(aig_path)
-                    candidates = [Path(aig_path + ".lec")]
-                    # Strip one intermediate extension: foo.opt.aig -> foo.aig.lec
-                    inner = p.stem  # e.g. "foo.opt"
-                    if "." in inner:
-                        base = inner.rsplit(".", 1)[0]  # "foo"
-                        candidates.append(p.parent / (base + p.suffix + ".lec"))
-                    for lec_sidecar in candidates:
-                        if lec_sidecar.exists():
-                            try:
-                                import json as _json
-
-                                lec_data = _json.loads(lec_sidecar.read_text())
-                                metrics.update(lec_data)
-                            except Exception:
-                                pass
-                            break
-
-                # Merge TV (translation validation) sidecar if present (<aig>.tv).
-                if aig_path:
-                    tv_candidates = [Path(aig_path + ".tv")]
-                    inner = Path(aig_path).stem
-                    if "." in inner:
-                        base = inner.rsplit(".", 1)[0]
-                        tv_candidates.append(
-                            Path(aig_path).parent
-                            / (base + Path(aig_path).suffix + ".tv")
-                        )
-                    for tv_sidecar in tv_candidates:
-                        if tv_sidecar.exists():
-                            try:
-                                import json as _json
-
-                                tv_data = _json.loads(tv_sidecar.read_text())
-                                if "tv_status" in tv_data:
-                                    metrics["tv_status"] = tv_data["tv_status"]
-                                tv_results = tv_data.get("tv_results", [])
-                                if tv_results:
-                                    metrics["tv_total"] = len(tv_results)
-                                    metrics["tv_verified"] = sum(
-                                        1
-                                        for r in tv_results
-                                        if r.get("status") == "equiv"
-                                    )
-                                    metrics["tv_results"] = tv_results
-                            except Exception:
-                                pass
-                            break
-
-                mode = metrics.get("mode")
-                key = f"{benchmark_name}@{mode}" if mode else benchmark_name
-                # If still collides (unexpected), add a numeric suffix.
-                suffix = 2
-                while key in results:
-                    key = f"{benchmark_name}@{mode or 'dup'}#{suffix}"
-                    suffix += 1
-
-                results[key] = metrics
-
-                if args.verbose:
-                    print(f"  Processed: {key}")
-                    print(f"    Metrics: {metrics}")
-
-        except Exception as e:
-            print(f"Warning: Failed to process {json_file}: {e}", file=sys.stderr)
-
-    # Create summary
-    summary = {
+    workers = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
+    workers = max(1, workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        parsed = _parse_results(list(executor.map(_read_result, json_files)))
+        loaded = list(executor.map(_try_load_result, json_files, parsed))
+
+    header = {
         "tool": args.tool,
         "version": args.version,
         "timestamp": datetime.now().isoformat(),
-        "total_benchmarks": len(results),
-        "benchmarks": results,
     }
+    warnings = io.StringIO()
+    verbose_log = io.StringIO() if args.verbose else None
+    results = _keyed_results(loaded, warnings, verbose_log)
 
     # Write summary JSON
-    with open(output_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    count = _write_summary(output_path, header, results, pretty=args.pretty)
+
+    sys.stderr.write(warnings.getvalue())
+    if verbose_log is not None:
+        sys.stdout.write(verbose_log.getvalue())
 
-    print(f"\nAggregated {len(results)} results")
+    print(f"\nAggregated {count} results")
     print(f"Summary written to: {output_path}")
 
     return 0
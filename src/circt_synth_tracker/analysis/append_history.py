@@ -5,14 +5,115 @@ Append current synthesis results to a cumulative history JSON file.
 Usage:
     append-history --circt circt-summary.json --yosys yosys-summary.json -o history.json
     append-history --circt circt-summary.json --yosys yosys-summary.json -o history.json --max-days 90
+    append-history --circt circt-summary.json --yosys yosys-summary.json -o history.ndjson
+
+A ``.ndjson`` output stores one entry per line, so a new day is appended
+without re-reading or re-writing earlier entries.
 """
 
 import argparse
-import json
+import hashlib
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from circt_synth_tracker.analysis.json_io import dump_json, dumps, load_json, loads
+
+
+def _parse_ndjson(data):
+    return [loads(line) for line in data.splitlines() if line.strip()]
+
+
+def load_history(history_path):
+    """Load history entries from a JSON array or, for ``.ndjson``, one per line."""
+    history_path = Path(history_path)
+    if history_path.suffix == ".ndjson":
+        return _parse_ndjson(history_path.read_bytes())
+    return load_json(history_path)
+
+
+def _read_summary(path_arg, label):
+    try:
+        return Path(path_arg).read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{label} summary not found: {path_arg}") from None
+
+
+@dataclass
+class Summary:
+    """The fields of an aggregate-results summary that history entries keep."""
+
+    version: str = "unknown"
+    benchmarks: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, data, label):
+        """Decode summary *data*, raising ValueError if its shape is wrong."""
+        summary = loads(data)
+        if not isinstance(summary, dict):
+            raise ValueError(f"{label} summary is not a JSON object")
+        version = summary.get("version", "unknown")
+        benchmarks = summary.get("benchmarks", {})
+        if not isinstance(version, str):
+            raise ValueError(f"{label} summary version is not a string")
+        if not isinstance(benchmarks, dict):
+            raise ValueError(f"{label} summary benchmarks is not a JSON object")
+        return cls(version, benchmarks)
+
+
+def _summary_fields(data, digest, last, tool, label):
+    """Return the Summary for one tool's summary *data*.
+
+    When the latest history entry was built from a byte-identical summary,
+    its version and benchmarks are reused instead of parsing *data* again.
+    """
+    if last is not None and last.get(f"{tool}_hash") == digest:
+        return Summary(last.get(f"{tool}_version", "unknown"), last[tool]["benchmarks"])
+    return Summary.from_json(data, label)
+
+
+def _ndjson_tail(data):
+    """Return (end, start, count, last_entry) for NDJSON history *data*.
+
+    *end* is the length without trailing newlines and *start* the offset of
+    the last line; only that line is decoded.
+    """
+    body = data.rstrip(b"\n")
+    if not body:
+        return 0, 0, 0, None
+    start = body.rfind(b"\n") + 1
+    return len(body), start, body.count(b"\n") + 1, loads(body[start:])
+
+
+def _append_ndjson(history_path, data, entry, max_days):
+    """Append *entry* to the NDJSON history *data* in place.
+
+    Entries are kept sorted by date, so only the last line is decoded: a
+    newer date is appended and a same-date re-run replaces the last line.
+    Returns the new entry count, or None when the file needs a full rewrite
+    (an out-of-order date, or trimming to *max_days*).
+    """
+    end, start, count, last = _ndjson_tail(data)
+    offset, prefix = 0, b""
+    if last is not None:
+        last_date = last.get("date", "")
+        if entry["date"] < last_date:
+            return None
+        if entry["date"] == last_date:
+            offset = start
+            count -= 1
+        else:
+            offset, prefix = end, b"\n"
+    if max_days > 0 and count + 1 > max_days:
+        return None
+
+    with open(history_path, "r+b" if data else "wb") as f:
+        f.seek(offset)
+        f.write(prefix + dumps(entry) + b"\n")
+        f.truncate()
+    return count + 1
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -24,7 +125,7 @@ def main():
         "-o",
         "--output",
         required=True,
-        help="History JSON file (read and updated in-place)",
+        help="History JSON or NDJSON file (read and updated in-place)",
     )
     parser.add_argument(
         "--max-days",
@@ -33,48 +134,96 @@ def main():
         help="Maximum entries to retain (0 = unlimited)",
     )
     parser.add_argument("--date", help="Override date (YYYY-MM-DD, default: today UTC)")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent a JSON history for human inspection (default: compact)",
+    )
 
     args = parser.parse_args()
 
-    # Load existing history
+    # Read summaries (each file is read exactly once)
+    try:
+        circt_data = _read_summary(args.circt, "CIRCT")
+        yosys_data = _read_summary(args.yosys, "Yosys")
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    # Load existing history (NDJSON histories only decode their last line
+    # unless the in-place append below cannot be used)
     history_path = Path(args.output)
-    if history_path.exists():
-        with open(history_path) as f:
-            history = json.load(f)
+    ndjson = history_path.suffix == ".ndjson"
+    history = []
+    if ndjson:
+        try:
+            data = history_path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        _, _, count, last = _ndjson_tail(data)
     else:
-        history = []
-
-    # Load summaries
-    for path_arg, label in [(args.circt, "CIRCT"), (args.yosys, "Yosys")]:
-        if not Path(path_arg).exists():
-            print(f"Error: {label} summary not found: {path_arg}", file=sys.stderr)
-            return 1
-
-    with open(args.circt) as f:
-        circt = json.load(f)
-    with open(args.yosys) as f:
-        yosys = json.load(f)
+        try:
+            history = load_json(history_path)
+        except FileNotFoundError:
+            pass
+        count = len(history)
+        last = history[-1] if history else None
 
     date = args.date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
+    circt_hash = hashlib.blake2b(circt_data, digest_size=16).hexdigest()
+    yosys_hash = hashlib.blake2b(yosys_data, digest_size=16).hexdigest()
+
+    # A re-run for the latest date with byte-identical summaries would
+    # rewrite the same entry; leave the history untouched instead.
+    if (
+        last is not None
+        and last.get("date") == date
+        and last.get("circt_hash") == circt_hash
+        and last.get("yosys_hash") == yosys_hash
+        and not (args.max_days > 0 and count > args.max_days)
+    ):
+        print(f"History unchanged: {count} entries, latest: {date}")
+        return 0
+    try:
+        circt = _summary_fields(circt_data, circt_hash, last, "circt", "CIRCT")
+        yosys = _summary_fields(yosys_data, yosys_hash, last, "yosys", "Yosys")
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
     entry = {
         "date": date,
-        "circt_version": circt.get("version", "unknown"),
-        "yosys_version": yosys.get("version", "unknown"),
-        "circt": {"benchmarks": circt.get("benchmarks", {})},
-        "yosys": {"benchmarks": yosys.get("benchmarks", {})},
+        "circt_version": circt.version,
+        "yosys_version": yosys.version,
+        "circt_hash": circt_hash,
+        "yosys_hash": yosys_hash,
+        "circt": {"benchmarks": circt.benchmarks},
+        "yosys": {"benchmarks": yosys.benchmarks},
     }
 
-    # Replace any existing entry for the same date (idempotent)
-    history = [e for e in history if e.get("date") != date]
-    history.append(entry)
-    history.sort(key=lambda e: e.get("date", ""))
+    if ndjson:
+        count = _append_ndjson(history_path, data, entry, args.max_days)
+        if count is not None:
+            print(f"History updated: {count} entries, latest: {date}")
+            print(f"Written to: {history_path}")
+            return 0
+        history = _parse_ndjson(data)
+
+    # Key entries by date so a re-run replaces the existing entry for the same
+    # date (idempotent), then order by sorting just the date strings.
+    history_by_date = {e.get("date", ""): e for e in history}
+    history_by_date[date] = entry
+    dates = sorted(history_by_date)
 
     if args.max_days > 0:
-        history = history[-args.max_days :]
+        dates = dates[-args.max_days :]
+    history = [history_by_date[d] for d in dates]
 
-    with open(history_path, "w") as f:
-        json.dump(history, f, indent=2)
+    if ndjson:
+        history_path.write_bytes(b"".join(dumps(e) + b"\n" for e in history))
+    else:
+        dump_json(history, history_path, indent=args.pretty)
 
     print(f"History updated: {len(history)} entries, latest: {date}")
     print(f"Written to: {history_path}")
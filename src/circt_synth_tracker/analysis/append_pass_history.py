@@ -9,6 +9,7 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from circt_synth_tracker.analysis.json_io import load_json
 from circt_synth_tracker.analysis.pass_compare_results import (
     compare_rows,
     compare_rows_for_metric,
@@ -29,8 +30,7 @@ def _load_summary(path_arg: str, label: str) -> dict:
     path = Path(path_arg)
     if not path.exists():
         raise FileNotFoundError(f"{label} summary not found: {path}")
-    with path.open() as f:
-        return json.load(f)
+    return load_json(path)
 
 
 def build_history_entry(circt: dict, abc: dict, date: str) -> dict:
@@ -84,8 +84,7 @@ def main() -> int:
 
     history_path = Path(args.output)
     if history_path.exists():
-        with history_path.open() as f:
-            history = json.load(f)
+        history = load_json(history_path)
     else:
         history = []
 
@@ -8,18 +8,71 @@ Usage:
 
 import argparse
 import json
+import os
+import signal
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from circt_synth_tracker.analysis.compare_results import _run_one_cec
+from circt_synth_tracker.analysis.json_io import load_json
 from circt_synth_tracker.tools import find_abc
 
+# Wall-clock limit for one ABC run; ABC's own ``cec -T`` limit is lower.
+_ABC_TIMEOUT = 30
+# Bytes at the end of ABC's stdout and stderr searched for the CEC verdict.
+_VERDICT_TAIL = 4096
+
+
+def _kill_process_group(proc):
+    """Kill *proc* and any children it started in its session."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    proc.kill()
+
+
+def _run_one_cec(abc, benchmark_name, aig1, aig2):
+    """Run CEC on a single benchmark pair. Returns (benchmark_name, status, detail, output)."""
+    try:
+        # ABC gets no stdin so it cannot wait on a prompt, and runs in its own
+        # session so a timeout also kills anything it spawned; otherwise a
+        # surviving child keeps the pipes open and holds the worker.
+        with subprocess.Popen(
+            [abc, "-c", f"cec -T 20 {aig1} {aig2}"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        ) as proc:
+            try:
+                stdout, stderr = proc.communicate(timeout=_ABC_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                _kill_process_group(proc)
+                proc.communicate()
+                return (benchmark_name, "timeout", "timeout", "")
+        # ABC prints its verdict last, so only the tail of each stream is
+        # searched; the combined output is decoded once.
+        verdict = stdout[-_VERDICT_TAIL:] + b"\n" + stderr[-_VERDICT_TAIL:]
+        output = (stdout + stderr).decode("utf-8", "replace")
+        if b"Networks are equivalent" in verdict:
+            return (benchmark_name, "equiv", None, output)
+        elif b"Networks are NOT" in verdict or b"not equivalent" in verdict.lower():
+            return (benchmark_name, "non-equiv", None, output)
+        else:
+            detail = (
+                "\n".join(output.strip().splitlines()[-3:]) if output.strip() else ""
+            )
+            return (benchmark_name, "error", f"unexpected output: {detail}", output)
+    except Exception as e:
+        return (benchmark_name, "error", str(e), "")
+
 
 def run_cec(summaries, abc_exe=None, jobs=None):
     """Run CEC between the first two tools in summaries. Returns status_map dict."""
-    import os
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     try:
         abc = find_abc(abc_exe)
     except FileNotFoundError as e:
@@ -31,9 +84,11 @@ def run_cec(summaries, abc_exe=None, jobs=None):
         print("Error: Need at least 2 tools for equivalence check", file=sys.stderr)
         return {}
 
+    tool_bms = {name: s.get("benchmarks", {}) for name, s in summaries.items()}
     all_benchmarks = set()
-    for summary in summaries.values():
-        all_benchmarks.update(summary.get("benchmarks", {}).keys())
+    for bms in tool_bms.values():
+        all_benchmarks.update(bms)
+    checked_bms = [tool_bms[t] for t in tool_names[:2]]
 
     print(f"\n=== Equivalence Check ({tool_names[0]} vs {tool_names[1]}) ===\n")
 
@@ -42,9 +97,8 @@ def run_cec(summaries, abc_exe=None, jobs=None):
     to_check = []
     for benchmark_name in sorted(all_benchmarks):
         aig_files = {}
-        for tool_name in tool_names[:2]:
-            bdata = summaries[tool_name].get("benchmarks", {}).get(benchmark_name, {})
-            aig_path = bdata.get("filename")
+        for tool_name, bms in zip(tool_names[:2], checked_bms):
+            aig_path = bms.get(benchmark_name, {}).get("filename")
             if aig_path:
                 aig_files[tool_name] = aig_path
 
@@ -81,12 +135,18 @@ def run_cec(summaries, abc_exe=None, jobs=None):
                 executor.submit(_run_one_cec, abc, name, a1, a2): name
                 for name, a1, a2 in to_check
             }
-            for future in as_completed(futures):
-                result = future.result()
-                benchmark_name, status, detail, output = result
-                if output and status != "equiv":
-                    print(f"[cec] {benchmark_name}:\n{output}", file=sys.stderr)
-                cec_results[name_to_idx[benchmark_name]] = result
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    benchmark_name, status, detail, output = result
+                    if output and status != "equiv":
+                        print(f"[cec] {benchmark_name}:\n{output}", file=sys.stderr)
+                    cec_results[name_to_idx[benchmark_name]] = result
+            except KeyboardInterrupt:
+                # Drop the queued checks so Ctrl-C does not wait for every
+                # remaining ABC run to time out.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
     for benchmark_name, status, detail, output in cec_results:
         if output and status != "equiv":
@@ -154,10 +214,9 @@ def main():
             print(f"Error: File not found: {path}", file=sys.stderr)
             return 1
         try:
-            with open(path) as f:
-                data = json.load(f)
-                tool_name = data.get("tool", path.stem)
-                summaries[tool_name] = data
+            data = load_json(path)
+            tool_name = data.get("tool", path.stem)
+            summaries[tool_name] = data
         except Exception as e:
             print(f"Error loading {path}: {e}", file=sys.stderr)
             return 1
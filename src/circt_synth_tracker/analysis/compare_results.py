@@ -10,48 +10,85 @@ Usage:
 """
 
 import argparse
-import json
+import functools
+import hashlib
+import itertools
 import math
-import subprocess
+import operator
+import os
+import re
+import shutil
+import string
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from html import escape
 from pathlib import Path
 
-from tabulate import tabulate
+from circt_synth_tracker.analysis import report_formatting
+from circt_synth_tracker.analysis.check_cec import run_cec
+from circt_synth_tracker.analysis.json_io import dumps, load_json
+from circt_synth_tracker.analysis.report_formatting import (
+    background_style,
+    format_metric_cell_html,
+)
 
-from circt_synth_tracker.analysis.report_formatting import format_metric_cell_html
 
+def run_equiv_check(summaries, abc_exe=None, jobs=None):
+    """Run combinational equivalence check between AIG files across all tools."""
+    return run_cec(summaries, abc_exe, jobs)
+
+
+def _report_cache_key(args):
+    """Return the cache key for an HTML report export, or None.
+
+    Only full HTML reports from pre-computed inputs are cacheable. The key
+    covers everything that shapes the report: each summary and the CEC file
+    (by path, mtime and size, in argument order), the History link, and the
+    report code itself. None is also returned when an input cannot be stat'ed,
+    so the normal path reports the error.
+    """
+    if args.format != "html" or not args.export or args.benchmark:
+        return None
+    if args.equiv_check and not args.cec:
+        return None
+
+    key = hashlib.blake2b(digest_size=16)
+    files = [*args.summaries, args.cec, __file__, report_formatting.__file__]
+    for name in files:
+        if name is None:
+            key.update(b"-\0")
+            continue
+        try:
+            st = os.stat(name)
+        except OSError:
+            return None
+        key.update(f"{os.path.abspath(name)}:{st.st_mtime_ns}:{st.st_size}\0".encode())
+    key.update(repr(args.timeseries_url).encode())
+    return key.hexdigest()
 
-def _run_one_cec(abc, benchmark_name, aig1, aig2):
-    """Run CEC on a single benchmark pair. Returns (benchmark_name, status, detail, output)."""
+
+def _load_summary(summary_file):
+    """Load one summary file, returning (tool_name, data, error).
+
+    *error* is the message to report instead of raising, so files can be
+    loaded concurrently and diagnosed in argument order afterwards.
+    """
+    path = Path(summary_file)
     try:
-        proc = subprocess.run(
-            [abc, "-c", f"cec -T 20 {aig1} {aig2}"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        output = proc.stdout + proc.stderr
-        if "Networks are equivalent" in output:
-            return (benchmark_name, "equiv", None, output)
-        elif "Networks are NOT" in output or "not equivalent" in output.lower():
-            return (benchmark_name, "non-equiv", None, output)
-        else:
-            detail = (
-                "\n".join(output.strip().splitlines()[-3:]) if output.strip() else ""
-            )
-            return (benchmark_name, "error", f"unexpected output: {detail}", output)
-    except subprocess.TimeoutExpired:
-        return (benchmark_name, "timeout", "timeout", "")
+        data = load_json(path)
+        return data.get("tool", path.stem), data, None
+    except FileNotFoundError:
+        return None, None, f"Error: File not found: {path}"
     except Exception as e:
-        return (benchmark_name, "error", str(e), "")
+        return None, None, f"Error loading {path}: {e}"
 
 
-def run_equiv_check(summaries, abc_exe=None, jobs=None):
-    """Run combinational equivalence check between AIG files across all tools."""
-    from circt_synth_tracker.analysis.check_cec import run_cec
-
-    return run_cec(summaries, abc_exe, jobs)
+def _stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 def main():
@@ -98,7 +135,12 @@ def main():
         "--jobs",
         type=int,
         default=None,
-        help="Number of parallel equivalence checks (default: number of available CPU cores)",
+        help="Number of parallel equivalence checks and Markdown report workers (default: number of available CPU cores)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse HTML reports from this directory when the summaries, CEC file and options are unchanged",
     )
 
     args = parser.parse_args()
@@ -114,21 +156,31 @@ def main():
         elif ext == ".md":
             args.format = "markdown"
 
+    # Reuse a cached HTML report built from identical inputs
+    cache_path = None
+    if args.cache_dir:
+        key = _report_cache_key(args)
+        if key is not None:
+            cache_path = Path(args.cache_dir) / f"{key}.html"
+            try:
+                shutil.copyfile(cache_path, args.export)
+            except FileNotFoundError:
+                pass
+            else:
+                print(f"HTML report reused from cache: {args.export}")
+                return 0
+    export_stat = _stat_or_none(args.export) if cache_path else None
+
     # Load all summary files
+    # Reads and parses release the GIL, so a few threads overlap the I/O.
     summaries = {}
-    for summary_file in args.summaries:
-        path = Path(summary_file)
-        if not path.exists():
-            print(f"Error: File not found: {path}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(args.summaries)))) as ex:
+        loaded = list(ex.map(_load_summary, args.summaries))
+    for tool_name, data, error in loaded:
+        if error is not None:
+            print(error, file=sys.stderr)
             continue
-
-        try:
-            with open(path, "r") as f:
-                data = json.load(f)
-                tool_name = data.get("tool", path.stem)
-                summaries[tool_name] = data
-        except Exception as e:
-            print(f"Error loading {path}: {e}", file=sys.stderr)
+        summaries[tool_name] = data
 
     if not summaries:
         print("Error: No valid summary files loaded", file=sys.stderr)
@@ -142,8 +194,7 @@ def main():
         if not cec_path.exists():
             print(f"Error: CEC file not found: {cec_path}", file=sys.stderr)
             return 1
-        with open(cec_path) as f:
-            equiv_results = json.load(f).get("benchmarks", {})
+        equiv_results = load_json(cec_path).get("benchmarks", {})
     elif args.equiv_check:
         equiv_results = run_equiv_check(summaries, args.abc, args.jobs) or {}
 
@@ -155,9 +206,21 @@ def main():
     else:
         # Compare all benchmarks
         compare_all(
-            summaries, args.format, args.export, args.timeseries_url, equiv_results
+            summaries,
+            args.format,
+            args.export,
+            args.timeseries_url,
+            equiv_results,
+            args.jobs,
         )
 
+    # Store the report only if this run actually (re)wrote it
+    if cache_path is not None and _stat_or_none(args.export) != export_stat:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(args.export, tmp_path)
+        os.replace(tmp_path, cache_path)
+
     return 0
 
 
@@ -174,49 +237,92 @@ def compare_benchmark(
             comparison[tool_name] = benchmarks[benchmark_name]
 
     if export_path:
-        output = None
+        # Markdown and HTML are written straight to the export file
         if format_type == "json":
-            import json
-
-            output = json.dumps(comparison, indent=2)
-        elif format_type == "markdown":
-            # Capture Markdown output
-            import io
-            from contextlib import redirect_stdout
-
-            f = io.StringIO()
-            with redirect_stdout(f):
-                display_markdown(comparison, metric_filter)
-            output = f.getvalue()
+            Path(export_path).write_bytes(dumps(comparison, indent=True))
+        elif format_type == "markdown" and comparison:
+            with open(export_path, "w", encoding="utf-8") as f:
+                display_markdown(comparison, metric_filter, out=f)
         elif format_type == "html":
-            # Capture HTML output
-            import io
-            from contextlib import redirect_stdout
-
-            f = io.StringIO()
-            with redirect_stdout(f):
-                display_html(comparison, benchmark_name, metric_filter)
-            output = f.getvalue()
-
-        if output:
-            with open(export_path, "w") as f:
-                f.write(output)
-            print(f"Results exported to {export_path}")
+            with open(export_path, "w", encoding="utf-8") as f:
+                display_html(comparison, benchmark_name, metric_filter, out=f)
+        else:
+            return
+        print(f"Results exported to {export_path}")
     else:
         display_comparison(comparison, benchmark_name, format_type, metric_filter)
 
 
+def _build_index(summaries):
+    """Index every benchmark in *summaries* in a single pass.
+
+    Returns ``{benchmark_name: {"category": ..., "by_tool": {tool: data}}}``.
+    The category is taken from the first tool (in *summaries* order) that has
+    the benchmark, and ``by_tool`` follows the same tool order.
+    """
+    index = {}
+    for tool_name, summary in summaries.items():
+        for benchmark_name, data in summary.get("benchmarks", {}).items():
+            entry = index.get(benchmark_name)
+            if entry is None:
+                entry = index[benchmark_name] = {
+                    "category": data.get("category", "Other"),
+                    "by_tool": {},
+                }
+            entry["by_tool"][tool_name] = data
+    return index
+
+
+def _group_by_category(index):
+    """Return {category: (benchmark_name, ...)} with categories and names sorted.
+
+    Every report section iterates these tuples as-is, so they are sorted here
+    once rather than at each use, and are immutable so no section can reorder
+    them for the others.
+    """
+    # Sorting (category, name) pairs leaves each category's names contiguous,
+    # so they are grouped without a dict lookup per benchmark.
+    pairs = sorted((entry["category"], name) for name, entry in index.items())
+    return {
+        category: tuple(name for _, name in group)
+        for category, group in itertools.groupby(pairs, key=operator.itemgetter(0))
+    }
+
+
+def build_comparisons(index):
+    """Return {benchmark_name: {tool: data}} for benchmarks worth comparing.
+
+    Only tools with a non-empty result are kept, and only benchmarks with at
+    least two such tools are included, in sorted name order. The JSON and
+    Markdown reports and the per-benchmark console output all select their
+    benchmarks from this mapping.
+    """
+    comparisons = {}
+    for benchmark_name in sorted(index):
+        comparison = {
+            tool: data
+            for tool, data in index[benchmark_name]["by_tool"].items()
+            if data
+        }
+        if len(comparison) >= 2:
+            comparisons[benchmark_name] = comparison
+    return comparisons
+
+
 def compare_all(
-    summaries, format_type, export_path=None, timeseries_url=None, equiv_results=None
+    summaries,
+    format_type,
+    export_path=None,
+    timeseries_url=None,
+    equiv_results=None,
+    jobs=None,
 ):
     """Compare all benchmarks across all tools."""
 
-    # Collect all unique benchmark names
-    all_benchmarks = set()
-    for summary in summaries.values():
-        all_benchmarks.update(summary.get("benchmarks", {}).keys())
+    # Index all unique benchmark names with their per-tool results
+    index = _build_index(summaries)
 
-    if not all_benchmarks:
+    if not index:
         print("No benchmarks found in summaries")
         return
 
@@ -227,275 +333,253 @@ def compare_all(
         )
 
     # Exclude pass-benchmark-style entries from compare-results outputs.
-    filtered = set()
-    for benchmark_name in all_benchmarks:
-        keep = False
-        for summary in summaries.values():
-            bd = summary.get("benchmarks", {}).get(benchmark_name)
-            if bd and not _is_pass_like(bd):
-                keep = True
-                break
-        if keep:
-            filtered.add(benchmark_name)
-    all_benchmarks = filtered
-
-    if not all_benchmarks:
+    index = {
+        benchmark_name: entry
+        for benchmark_name, entry in index.items()
+        if any(bd and not _is_pass_like(bd) for bd in entry["by_tool"].values())
+    }
+
+    if not index:
         print("No non-pass benchmarks found in summaries")
         return
 
-    print(f"\nFound {len(all_benchmarks)} unique benchmarks\n")
+    # Keep JSON output free of the human-readable preamble
+    if format_type != "json":
+        print(f"\nFound {len(index)} unique benchmarks\n")
 
     # If HTML export requested, generate full report
     if export_path and format_type == "html":
         generate_html_report(
-            summaries, all_benchmarks, export_path, timeseries_url, equiv_results
+            summaries, index, export_path, timeseries_url, equiv_results
         )
         return
 
+    comparisons = build_comparisons(index)
+
     # If JSON export requested, generate combined JSON
     if export_path and format_type == "json":
-        generate_json_report(summaries, all_benchmarks, export_path)
+        generate_json_report(summaries, index, export_path, comparisons)
         return
 
     # If Markdown export requested, generate combined Markdown
     if export_path and format_type == "markdown":
-        generate_markdown_report(summaries, all_benchmarks, export_path, equiv_results)
+        generate_markdown_report(
+            summaries, index, export_path, equiv_results, comparisons, jobs
+        )
         return
 
-    # Compare each benchmark
-    for benchmark_name in sorted(all_benchmarks):
-        comparison = {}
+    # Compare each benchmark that multiple tools have
+    for benchmark_name, comparison in comparisons.items():
+        display_comparison(comparison, benchmark_name, format_type)
+
 
-        for tool_name, summary in summaries.items():
-            benchmarks = summary.get("benchmarks", {})
-            if benchmark_name in benchmarks:
-                comparison[tool_name] = benchmarks[benchmark_name]
+def _embedded_json(obj):
+    """Serialize *obj* as compact JSON text for a ``<script>`` block.
 
-        if len(comparison) > 1:  # Only show if multiple tools have this benchmark
-            display_comparison(comparison, benchmark_name, format_type)
+    Goes through :mod:`json_io`, so orjson is used when installed.
+    """
+    return dumps(obj).decode("utf-8")
 
 
-def _outlier_table_section(
+def _paired_metric_values(
     summaries, sorted_categories, benchmarks_by_category, tool_names
 ):
-    """Return HTML for a per-benchmark ranking table sorted by % difference."""
-    import json as _json
+    """Return the metric values of benchmarks both of the first two tools ran.
 
-    baseline_tool = tool_names[0]
-    compare_tool = tool_names[1]
+    Each entry is ``(benchmark_name, category, baseline_values,
+    compare_values, pct_diffs)``, where the tuples follow :data:`_METRIC_KEYS`
+    and *pct_diffs* comes from :func:`_pct_diffs`. Entries are in category
+    then name order. The bar charts and the ranking table share this list
+    instead of each looking up and diffing every metric again.
+    """
+    baseline_bms = summaries[tool_names[0]]["benchmarks"]
+    compare_bms = summaries[tool_names[1]]["benchmarks"]
+    pairs = []
+    for category in sorted_categories:
+        for bname in benchmarks_by_category[category]:
+            bd = baseline_bms.get(bname)
+            cd = compare_bms.get(bname)
+            if bd and cd:
+                bvals = tuple(map(bd.get, _METRIC_KEYS))
+                cvals = tuple(map(cd.get, _METRIC_KEYS))
+                pairs.append((bname, category, bvals, cvals, _pct_diffs(bvals, cvals)))
+    return pairs
 
-    table_metrics = [
-        ("gates", "Gates"),
-        ("depth", "Depth"),
-        ("area_asap7", "Area (ASAP7)"),
-        ("delay_asap7", "Delay (ASAP7)"),
-        ("area_sky130", "Area (Sky130)"),
-        ("delay_sky130", "Delay (Sky130)"),
-    ]
 
-    rows = []
-    for category in sorted_categories:
-        for bname in sorted(benchmarks_by_category[category]):
-            bd = summaries[baseline_tool]["benchmarks"].get(bname, {})
-            cd = summaries[compare_tool]["benchmarks"].get(bname, {})
-            if not bd or not cd:
-                continue
-            row = {
-                "name": bname,
-                "category": category,
-                "url": _benchmark_source_url(bname, category),
-            }
-            for mk, _ in table_metrics:
-                bv, cv = bd.get(mk), cd.get(mk)
-                row[mk] = (
-                    round((cv - bv) / bv * 100, 2) if bv and cv and bv > 0 else None
-                )
-            rows.append(row)
+def _pct_diffs(bvals, cvals):
+    """Return the % differences of *cvals* to *bvals*, rounded to 2 places.
+
+    An entry is None unless both values are set and the baseline is positive.
+    """
+    return tuple(
+        round((cv - bv) / bv * 100, 2) if bv and cv and bv > 0 else None
+        for bv, cv in zip(bvals, cvals)
+    )
 
-    rows_json = _json.dumps(rows)
-    metrics_json = _json.dumps([{"key": mk, "label": ml} for mk, ml in table_metrics])
-    default_sort = "area_asap7"
-    b = escape(baseline_tool)
-    c = escape(compare_tool)
 
-    return f"""
+# Ranking table section filled in by _outlier_table_section(). It is a
+# %-format template, so the script's braces need no escaping.
+_OUTLIER_TABLE_HTML = """
         <h2>Benchmark Ranking</h2>
         <p style="color:#555; font-size:0.9em; margin-bottom:8px;">
-            All benchmarks sorted by <strong>{c}</strong> vs <strong>{b}</strong> difference.
+            All benchmarks sorted by <strong>%(c)s</strong> vs <strong>%(b)s</strong> difference.
             Click a column header to re-sort.
-            <span style="color:#4CAF50; font-weight:bold">Green</span> = {c} better &nbsp;
-            <span style="color:#f44336; font-weight:bold">Red</span> = {b} better.
+            <span style="color:#4CAF50; font-weight:bold">Green</span> = %(c)s better &nbsp;
+            <span style="color:#f44336; font-weight:bold">Red</span> = %(b)s better.
         </p>
         <div id="outlier-table-container"></div>
         <style>
-            #outlier-table-container table {{
+            #outlier-table-container table {
                 border-collapse: collapse;
-                width: 100%;
+                width: 100%%;
                 font-size: 13px;
                 margin-top: 8px;
-            }}
-            #outlier-table-container th, #outlier-table-container td {{
+            }
+            #outlier-table-container th, #outlier-table-container td {
                 border: 1px solid #ddd;
                 padding: 6px 8px;
                 text-align: right;
-            }}
-            #outlier-table-container th {{
+            }
+            #outlier-table-container th {
                 background: #4CAF50;
                 color: white;
                 cursor: pointer;
                 user-select: none;
                 white-space: nowrap;
-            }}
-            #outlier-table-container th:hover {{ background: #43a047; }}
-            #outlier-table-container th.sort-active {{ background: #1b5e20; }}
+            }
+            #outlier-table-container th:hover { background: #43a047; }
+            #outlier-table-container th.sort-active { background: #1b5e20; }
             #outlier-table-container td:nth-child(2),
-            #outlier-table-container th:nth-child(2) {{ text-align: left; }}
+            #outlier-table-container th:nth-child(2) { text-align: left; }
             #outlier-table-container td:nth-child(3),
-            #outlier-table-container th:nth-child(3) {{ text-align: left; font-size: 12px; color: #555; }}
-            #outlier-table-container tr:nth-child(even) {{ background: #f9f9f9; }}
-            #outlier-table-container tr:hover {{ background: #f0f0f0; }}
+            #outlier-table-container th:nth-child(3) { text-align: left; font-size: 12px; color: #555; }
+            #outlier-table-container tr:nth-child(even) { background: #f9f9f9; }
+            #outlier-table-container tr:hover { background: #f0f0f0; }
         </style>
         <script>
-        (function() {{
-            const ROWS = {rows_json};
-            const METRICS = {metrics_json};
-            let sortKey = '{default_sort}';
+        (function() {
+            const COLS = %(cols_json)s;
+            const METRICS = %(metrics_json)s;
+            let sortCol = %(default_sort)s;
             let sortAsc = false;
             let _firstRender = true;
 
-            function cellBg(v) {{
+            function cellBg(v) {
                 if (v === null || v === 0) return '';
                 const intensity = Math.min(Math.abs(v) / 20.0, 1.0);
                 const base = Math.round(200 - 50 * intensity);
                 return v < 0
-                    ? `rgb(${{base}},255,${{base}})`
-                    : `rgb(255,${{base}},${{base}})`;
-            }}
-
-            function render() {{
-                const sorted = [...ROWS].sort((a, b) => {{
-                    const av = a[sortKey] ?? (sortAsc ? Infinity : -Infinity);
-                    const bv = b[sortKey] ?? (sortAsc ? Infinity : -Infinity);
+                    ? `rgb(${base},255,${base})`
+                    : `rgb(255,${base},${base})`;
+            }
+
+            function render() {
+                const missing = sortAsc ? Infinity : -Infinity;
+                const order = COLS.names.map(function(_, i) { return i; });
+                order.sort((a, b) => {
+                    const av = COLS.metrics[a][sortCol] ?? missing;
+                    const bv = COLS.metrics[b][sortCol] ?? missing;
                     return sortAsc ? av - bv : bv - av;
-                }});
+                });
 
-                if (!_firstRender && typeof window._bcReorder === 'function') {{
-                    window._bcReorder(sorted.map(function(r) {{ return r.name; }}));
-                }}
+                if (!_firstRender && typeof window._bcReorder === 'function') {
+                    window._bcReorder(order.map(function(i) { return COLS.names[i]; }));
+                }
                 _firstRender = false;
 
                 let h = '<table><thead><tr>';
                 h += '<th onclick="void(0)">#</th>';
                 h += '<th onclick="void(0)">Benchmark</th>';
                 h += '<th onclick="void(0)">Category</th>';
-                METRICS.forEach(function(m) {{
-                    const active = m.key === sortKey ? ' class="sort-active"' : '';
-                    const arrow = m.key === sortKey ? (sortAsc ? ' ▲' : ' ▼') : '';
-                    h += `<th${{active}} data-key="${{m.key}}">${{m.label}}${{arrow}}</th>`;
-                }});
+                METRICS.forEach(function(m, mIdx) {
+                    const active = mIdx === sortCol ? ' class="sort-active"' : '';
+                    const arrow = mIdx === sortCol ? (sortAsc ? ' ▲' : ' ▼') : '';
+                    h += `<th${active} data-col="${mIdx}">${m.label}${arrow}</th>`;
+                });
                 h += '</tr></thead><tbody>';
 
-                sorted.forEach(function(row, i) {{
-                    const nameCell = row.url
-                        ? `<a href="${{row.url}}" target="_blank" style="color:inherit">${{row.name}}</a>`
-                        : row.name;
-                    h += `<tr><td>${{i + 1}}</td><td>${{nameCell}}</td><td>${{row.category}}</td>`;
-                    METRICS.forEach(function(m) {{
-                        const v = row[m.key];
+                order.forEach(function(r, i) {
+                    const name = COLS.names[r];
+                    const url = COLS.urls[r];
+                    const nameCell = url
+                        ? `<a href="${url}" target="_blank" style="color:inherit">${name}</a>`
+                        : name;
+                    h += `<tr><td>${i + 1}</td><td>${nameCell}</td><td>${COLS.categories[r]}</td>`;
+                    COLS.metrics[r].forEach(function(v) {
                         const bg = cellBg(v);
-                        const style = bg ? ` style="background:${{bg}}"` : '';
-                        const txt = v === null ? 'N/A' : (v > 0 ? '+' : '') + v.toFixed(1) + '%';
-                        h += `<td${{style}}>${{txt}}</td>`;
-                    }});
+                        const style = bg ? ` style="background:${bg}"` : '';
+                        const txt = v === null ? 'N/A' : (v > 0 ? '+' : '') + v.toFixed(1) + '%%';
+                        h += `<td${style}>${txt}</td>`;
+                    });
                     h += '</tr>';
-                }});
+                });
 
                 h += '</tbody></table>';
                 const container = document.getElementById('outlier-table-container');
                 container.innerHTML = h;
 
-                container.querySelectorAll('th[data-key]').forEach(function(th) {{
-                    th.addEventListener('click', function() {{
-                        const key = this.getAttribute('data-key');
-                        if (key === sortKey) {{ sortAsc = !sortAsc; }}
-                        else {{ sortKey = key; sortAsc = false; }}
+                container.querySelectorAll('th[data-col]').forEach(function(th) {
+                    th.addEventListener('click', function() {
+                        const col = Number(this.getAttribute('data-col'));
+                        if (col === sortCol) { sortAsc = !sortAsc; }
+                        else { sortCol = col; sortAsc = false; }
                         render();
-                    }});
-                }});
+                    });
+                });
 
-            }}
+            }
 
             render();
-        }})();
+        })();
         </script>
 """
 
 
-def _bar_chart_section(
-    summaries, sorted_categories, benchmarks_by_category, tool_names
-):
-    """Return an HTML string containing bar charts comparing two tools across all benchmarks."""
-    import json as _json
+def _outlier_table_section(pairs, tool_names):
+    """Return HTML for a per-benchmark ranking table sorted by % difference.
 
+    *pairs* is the result of :func:`_paired_metric_values`.
+    """
     baseline_tool = tool_names[0]
     compare_tool = tool_names[1]
 
-    chart_metrics = [
-        ("gates", "Gates"),
-        ("depth", "Depth"),
-        ("area_asap7", "Area (ASAP7)"),
-        ("delay_asap7", "Delay (ASAP7)"),
-        ("area_sky130", "Area (Sky130)"),
-        ("delay_sky130", "Delay (Sky130)"),
-    ]
+    # Columnar layout: one list per field, with the metric values of row i
+    # in metrics[i] (ordered like METRICS); the script sorts row indices.
+    names, categories, urls, metrics = [], [], [], []
+    for bname, category, _, _, pcts in pairs:
+        names.append(bname)
+        categories.append(category)
+        urls.append(_benchmark_source_url(bname, category))
+        metrics.append(pcts)
+
+    cols_json = _embedded_json(
+        {"names": names, "categories": categories, "urls": urls, "metrics": metrics}
+    )
+    metrics_json = _embedded_json(
+        [{"key": mk, "label": ml} for mk, ml in _TABLE_METRICS]
+    )
+    default_sort = _METRIC_KEYS.index("area_asap7")
+    b = escape(baseline_tool)
+    c = escape(compare_tool)
 
-    # Benchmarks ordered by category then name (same order as the detail table)
-    ordered = [
-        (bname, category)
-        for category in sorted_categories
-        for bname in sorted(benchmarks_by_category[category])
-        if summaries[baseline_tool]["benchmarks"].get(bname)
-        and summaries[compare_tool]["benchmarks"].get(bname)
-    ]
-    benchmarks = [b for b, _ in ordered]
+    return _OUTLIER_TABLE_HTML % {
+        "b": b,
+        "c": c,
+        "cols_json": cols_json,
+        "default_sort": default_sort,
+        "metrics_json": metrics_json,
+    }
 
-    metrics_data = {}
-    for metric_key, metric_label in chart_metrics:
-        values, base_vals, cmp_vals = [], [], []
-        for bname, _ in ordered:
-            bv = summaries[baseline_tool]["benchmarks"][bname].get(metric_key)
-            cv = summaries[compare_tool]["benchmarks"][bname].get(metric_key)
-            if bv and cv and bv > 0:
-                values.append(round((cv - bv) / bv * 100, 2))
-                base_vals.append(bv)
-                cmp_vals.append(cv)
-            else:
-                values.append(None)
-                base_vals.append(None)
-                cmp_vals.append(None)
-        metrics_data[metric_key] = {
-            "label": metric_label,
-            "values": values,
-            "baseline_vals": base_vals,
-            "compare_vals": cmp_vals,
-        }
 
-    chart_data_json = _json.dumps(
-        {
-            "benchmarks": benchmarks,
-            "baseline": baseline_tool,
-            "compare": compare_tool,
-            "metrics": metrics_data,
-        }
-    )
-
-    return f"""
+# Bar chart section filled in by _bar_chart_section(); a %-format template
+# like _OUTLIER_TABLE_HTML.
+_BAR_CHART_HTML = """
         <h2>Visual Comparison</h2>
         <p style="color:#555; font-size:0.9em; margin-bottom:4px;">
-            Each bar shows <strong>{escape(compare_tool)}</strong> relative to
-            <strong>{escape(baseline_tool)}</strong> (baseline&nbsp;=&nbsp;0%).
-            <span style="color:#4CAF50; font-weight:bold">Green</span> = {escape(compare_tool)} is better &nbsp;
-            <span style="color:#f44336; font-weight:bold">Red</span> = {escape(baseline_tool)} is better.
+            Each bar shows <strong>%(c)s</strong> relative to
+            <strong>%(b)s</strong> (baseline&nbsp;=&nbsp;0%%).
+            <span style="color:#4CAF50; font-weight:bold">Green</span> = %(c)s is better &nbsp;
+            <span style="color:#f44336; font-weight:bold">Red</span> = %(b)s is better.
         </p>
         <div id="bc-scroll-outer" style="overflow-x:auto; margin:20px 0 30px;">
             <div class="bar-charts-grid" id="bc-scroll-inner">
@@ -508,27 +592,36 @@ def _bar_chart_section(
             </div>
         </div>
         <script>
-        (function() {{
-            const CD = {chart_data_json};
-            const _bcInstances = {{}};
+        (function() {
+            const CD = %(chart_data_json)s;
+            const _bcInstances = {};
 
             // Immutable snapshot of original data, keyed by benchmark name
-            const _bcOrigIdx = {{}};
-            CD.benchmarks.forEach(function(n, i) {{ _bcOrigIdx[n] = i; }});
-            const _bcOrig = {{}};
-            Object.keys(CD.metrics).forEach(function(mk) {{
+            const _bcOrigIdx = {};
+            CD.benchmarks.forEach(function(n, i) { _bcOrigIdx[n] = i; });
+            const _bcOrig = {};
+            // %% difference to the baseline, rounded to 2 places like the
+            // ranking table; null unless both are set and the baseline is > 0
+            function pctDiff(bv, cv) {
+                return bv && cv && bv > 0
+                    ? Math.round((cv - bv) / bv * 100 * 100) / 100 : null;
+            }
+            Object.keys(CD.metrics).forEach(function(mk) {
                 const m = CD.metrics[mk];
-                _bcOrig[mk] = {{
+                m.values = m.baseline_vals.map(function(bv, i) {
+                    return pctDiff(bv, m.compare_vals[i]);
+                });
+                _bcOrig[mk] = {
                     values:       m.values.slice(),
                     baseline_vals: m.baseline_vals.slice(),
                     compare_vals:  m.compare_vals.slice(),
-                }};
-            }});
-            const _bcMetricKeys = {{
+                };
+            });
+            const _bcMetricKeys = {
                 'bc-gates': 'gates', 'bc-depth': 'depth',
                 'bc-area_asap7': 'area_asap7', 'bc-delay_asap7': 'delay_asap7',
                 'bc-area_sky130': 'area_sky130', 'bc-delay_sky130': 'delay_sky130',
-            }};
+            };
 
             const MIN_BAR_PX = 8;
             const outer = document.getElementById('bc-scroll-outer');
@@ -537,37 +630,37 @@ def _bar_chart_section(
             const chartW = Math.max(outerW, CD.benchmarks.length * MIN_BAR_PX);
             inner.style.width = chartW + 'px';
 
-            function colors(vals) {{
+            function colors(vals) {
                 return vals.map(v =>
                     v === null ? 'rgba(180,180,180,0.4)' :
                     v <= 0    ? 'rgba(76,175,80,0.75)'   : 'rgba(244,67,54,0.75)');
-            }}
-            function mkChart(canvasId, metricKey) {{
+            }
+            function mkChart(canvasId, metricKey) {
                 const m = CD.metrics[metricKey];
                 const canvas = document.getElementById(canvasId);
                 if (!canvas) return;
                 canvas.style.width = chartW + 'px';
                 canvas.style.height = '280px';
-                _bcInstances[canvasId] = new Chart(canvas, {{
+                _bcInstances[canvasId] = new Chart(canvas, {
                     type: 'bar',
-                    data: {{
+                    data: {
                         labels: CD.benchmarks.slice(),
-                        datasets: [{{
+                        datasets: [{
                             data: m.values.slice(),
                             backgroundColor: colors(m.values),
                             borderWidth: 0,
-                        }}],
-                    }},
-                    options: {{
+                        }],
+                    },
+                    options: {
                         responsive: false,
                         maintainAspectRatio: false,
-                        plugins: {{
-                            title: {{ display: true, text: m.label, font: {{ size: 13 }} }},
-                            legend: {{ display: false }},
-                            tooltip: {{
-                                callbacks: {{
+                        plugins: {
+                            title: { display: true, text: m.label, font: { size: 13 } },
+                            legend: { display: false },
+                            tooltip: {
+                                callbacks: {
                                     title: (items) => items[0].chart.data.labels[items[0].dataIndex],
-                                    label: function(ctx) {{
+                                    label: function(ctx) {
                                         const i = ctx.dataIndex;
                                         const mk2 = _bcMetricKeys[ctx.chart.canvas.id];
                                         const orig = _bcOrig[mk2];
@@ -579,29 +672,29 @@ def _bar_chart_section(
                                         return [
                                             CD.baseline + ': ' + (oi !== undefined ? orig.baseline_vals[oi] : 'N/A'),
                                             CD.compare  + ': ' + (oi !== undefined ? orig.compare_vals[oi]  : 'N/A'),
-                                            'Diff: ' + sign + v.toFixed(1) + '%',
+                                            'Diff: ' + sign + v.toFixed(1) + '%%',
                                         ];
-                                    }},
-                                }},
-                            }},
-                        }},
-                        scales: {{
-                            x: {{ ticks: {{ maxRotation: 60, font: {{ size: 9 }} }} }},
-                            y: {{
-                                title: {{
+                                    },
+                                },
+                            },
+                        },
+                        scales: {
+                            x: { ticks: { maxRotation: 60, font: { size: 9 } } },
+                            y: {
+                                title: {
                                     display: true,
-                                    text: '% vs ' + CD.baseline + '  (negative = ' + CD.compare + ' better)',
-                                    font: {{ size: 10 }},
-                                }},
-                                grid: {{
+                                    text: '%% vs ' + CD.baseline + '  (negative = ' + CD.compare + ' better)',
+                                    font: { size: 10 },
+                                },
+                                grid: {
                                     color: (ctx) => ctx.tick.value === 0
                                         ? 'rgba(0,0,0,0.4)' : 'rgba(0,0,0,0.07)',
-                                }},
-                            }},
-                        }},
-                    }},
-                }});
-            }}
+                                },
+                            },
+                        },
+                    },
+                });
+            }
             mkChart('bc-gates',       'gates');
             mkChart('bc-depth',       'depth');
             mkChart('bc-area_asap7',  'area_asap7');
@@ -610,25 +703,63 @@ def _bar_chart_section(
             mkChart('bc-delay_sky130','delay_sky130');
 
             // Called by the ranking table whenever its sort order changes
-            window._bcReorder = function(newOrder) {{
-                Object.entries(_bcInstances).forEach(function([canvasId, chart]) {{
+            window._bcReorder = function(newOrder) {
+                Object.entries(_bcInstances).forEach(function([canvasId, chart]) {
                     const mk = _bcMetricKeys[canvasId];
                     const orig = _bcOrig[mk];
-                    const newValues = newOrder.map(function(name) {{
+                    const newValues = newOrder.map(function(name) {
                         const i = _bcOrigIdx[name];
                         return i !== undefined ? orig.values[i] : null;
-                    }});
+                    });
                     chart.data.labels = newOrder.slice();
                     chart.data.datasets[0].data = newValues;
                     chart.data.datasets[0].backgroundColor = colors(newValues);
                     chart.update('none');
-                }});
-            }};
-        }})();
+                });
+            };
+        })();
         </script>
 """
 
 
+def _bar_chart_section(pairs, tool_names):
+    """Return an HTML string containing bar charts comparing two tools across all benchmarks.
+
+    *pairs* is the result of :func:`_paired_metric_values`.
+    """
+    baseline_tool = tool_names[0]
+    compare_tool = tool_names[1]
+    b = escape(baseline_tool)
+    c = escape(compare_tool)
+
+    # Benchmarks ordered by category then name (same order as the detail table)
+    benchmarks = [pair[0] for pair in pairs]
+
+    # Only the raw values are embedded; the script derives the % differences.
+    metrics_data = {}
+    for i, (metric_key, metric_label) in enumerate(zip(_METRIC_KEYS, _METRIC_LABELS)):
+        metrics_data[metric_key] = {
+            "label": metric_label,
+            "baseline_vals": [bvals[i] for _, _, bvals, _, _ in pairs],
+            "compare_vals": [cvals[i] for _, _, _, cvals, _ in pairs],
+        }
+
+    chart_data_json = _embedded_json(
+        {
+            "benchmarks": benchmarks,
+            "baseline": baseline_tool,
+            "compare": compare_tool,
+            "metrics": metrics_data,
+        }
+    )
+
+    return _BAR_CHART_HTML % {
+        "b": b,
+        "c": c,
+        "chart_data_json": chart_data_json,
+    }
+
+
 _REPO_ROOT = Path(__file__).parent.parent.parent.parent
 
 _CATEGORY_INFO = {
@@ -654,14 +785,219 @@ _CATEGORY_INFO = {
 }
 
 
+def _log_columns(benchmarks, metric_keys):
+    """Return {metric_key: {benchmark_name: log(value)}} for positive values.
+
+    Each value's logarithm is taken once and shared by every geometric mean
+    it contributes to (the overall row and its category row).
+    """
+    log = math.log
+    return {
+        key: {
+            benchmark_name: log(value)
+            for benchmark_name, data in benchmarks.items()
+            if (value := data.get(key)) and value > 0
+        }
+        for key in metric_keys
+    }
+
+
+def _category_of(benchmarks_by_category):
+    """Invert :func:`_group_by_category` into {benchmark_name: category}."""
+    return {
+        name: category
+        for category, names in benchmarks_by_category.items()
+        for name in names
+    }
+
+
+def _category_log_columns(columns, category_of):
+    """Split *columns* from :func:`_log_columns` by benchmark category.
+
+    Returns ``{metric_key: {category: [log, ...]}}`` from one pass over each
+    column, so the per-category geometric means need no membership test per
+    benchmark name. Benchmarks missing from *category_of* (see
+    :func:`_category_of`) are left out.
+    """
+    by_category = {}
+    for key, column in columns.items():
+        split = by_category[key] = {}
+        for benchmark_name, log in column.items():
+            category = category_of.get(benchmark_name)
+            if category is not None:
+                split.setdefault(category, []).append(log)
+    return by_category
+
+
+def _geo_mean_of_logs(logs):
+    """Return the geometric mean of a sequence of logarithms.
+
+    None is returned if *logs* is empty or None. Summing logarithms with math.fsum instead of multiplying values avoids
+    overflow and accumulated rounding error on long inputs.
+    """
+    if not logs:
+        return None
+    return math.exp(math.fsum(logs) / len(logs))
+
+
+# Metric columns shown for each tool in the per-benchmark tables, in order.
+# Lower is better for all of them.
+_METRIC_KEYS = (
+    "gates",
+    "depth",
+    "area_asap7",
+    "delay_asap7",
+    "area_sky130",
+    "delay_sky130",
+)
+# Display labels for _METRIC_KEYS, in the same order.
+_METRIC_LABELS = (
+    "Gates",
+    "Depth",
+    "Area (ASAP7)",
+    "Delay (ASAP7)",
+    "Area (Sky130)",
+    "Delay (Sky130)",
+)
+# (key, label) columns of the HTML ranking table. The script inserts labels
+# as markup, so they are escaped once here.
+_TABLE_METRICS = tuple(zip(_METRIC_KEYS, map(escape, _METRIC_LABELS)))
+
+
+# Tool and category names recur in every row group and, for the console HTML
+# output, in every benchmark; each distinct name is escaped once.
+_escape_name = functools.lru_cache(maxsize=1024)(escape)
+
+
+def _tabulate(*args, **kwargs):
+    """Call :func:`tabulate.tabulate`, importing it on first use.
+
+    tabulate (with wcwidth) is most of this module's import time, and HTML
+    and JSON exports never render a text table.
+    """
+    from tabulate import tabulate
+
+    return tabulate(*args, **kwargs)
+
+
+# tabulate options for Markdown tables whose cells are already formatted
+# text such as "123 (+4.5%)". Skipping number detection avoids a float()
+# attempt per cell; it only matters for alignment when a whole column looks
+# numeric, which Markdown renders the same either way.
+_MD_TEXT_TABLE = {"tablefmt": "github", "disable_numparse": True}
+
+
+def _render_github_md(headers, rows):
+    """Render a GitHub-flavored Markdown table without column padding.
+
+    Used for the per-benchmark tables of the Markdown report, which is
+    meant to be rendered rather than read raw, so tabulate's column-width
+    pass over every cell is not needed.
+    """
+    lines = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join("---" for _ in headers) + "|",
+    ]
+    lines.extend("| " + " | ".join(map(str, row)) + " |" for row in rows)
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _compare_metric_cell(value, baseline):
+    """Return (content, style) for a metric cell diffed against *baseline*.
+
+    Memoized because many benchmarks share the same (value, baseline) pair;
+    ``typed`` keeps e.g. ``1`` and ``1.0`` apart since they render differently.
+    """
+    if value == "N/A" or not baseline:
+        return str(value), ""
+    return format_metric_cell_html(
+        value, baseline, lower_is_better=True, line_break=True
+    )
+
+
+# Bound str.format methods for the percentage cells below; in these hot
+# helpers they are cheaper than the equivalent f-strings.
+_REPORT_PCT_FMT = "{} ({}{:.1f}%)".format
+_POS_PCT_FMT = "{} (+{:.1f}%)".format
+_NEG_PCT_FMT = "**{}** ({:.1f}%)".format
+
+
+def _memoize_cell(func):
+    """Memoize a Markdown cell formatter like :func:`_compare_metric_cell`.
+
+    Large suites repeat the same (value, baseline) pairs across benchmarks
+    and tools, so each distinct cell is formatted once. Unhashable metric
+    values bypass the cache.
+    """
+    cached = functools.lru_cache(maxsize=4096, typed=True)(func)
+
+    @functools.wraps(func)
+    def wrapper(value, baseline):
+        try:
+            return cached(value, baseline)
+        except TypeError:
+            return func(value, baseline)
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+def _md_value_cell(value, baseline=None):
+    """Format a Markdown cell of the baseline tool, which shows no difference.
+
+    *baseline* is ignored; it lets this stand in for the diff formatters.
+    """
+    if value is None or value == "N/A":
+        return "-"
+    return str(value)
+
+
+@_memoize_cell
+def _md_report_cell(value, baseline):
+    """Format a Markdown report detail cell with its % difference to *baseline*."""
+    if value is None or value == "N/A":
+        return "-"
+    if not baseline:
+        return str(value)
+    diff_pct = (value - baseline) / baseline * 100 if baseline > 0 else 0
+    return _REPORT_PCT_FMT(value, ("", "+")[diff_pct > 0], diff_pct)
+
+
+def _same_metric_values(values, baselines):
+    """Return True if *values* match *baselines* in both value and type.
+
+    Types are compared too because e.g. ``1`` and ``1.0`` are equal but are
+    formatted differently.
+    """
+    return values == baselines and all(
+        type(v) is type(b) for v, b in zip(values, baselines)
+    )
+
+
+@_memoize_cell
+def _md_display_cell(value, baseline):
+    """Format a display_markdown cell, bolding values better than *baseline*."""
+    if value is None or value == "N/A":
+        return "-"
+    if not baseline:
+        return str(value)
+    diff = value - baseline
+    diff_pct = (diff / baseline * 100) if baseline > 0 else 0
+    if diff > 0:
+        return _POS_PCT_FMT(value, diff_pct)
+    elif diff < 0:
+        return _NEG_PCT_FMT(value, diff_pct)
+    else:
+        return str(value)
+
+
 def _benchmark_source_url(benchmark_name, category):
     """Return a URL to the original source file for a benchmark, or None.
 
     Strips a trailing bitwidth suffix (e.g. ``add_16`` -> ``add``) and searches
     the local submodule/directory for the ``.sv`` file.
     """
-    import re
-
     info = _CATEGORY_INFO.get(category)
     if not info:
         return None
@@ -687,37 +1023,28 @@ def _benchmark_source_url(benchmark_name, category):
     return f"{info['github']}/blob/{info['branch']}/{rel_path}"
 
 
-def generate_html_report(
-    summaries, all_benchmarks, output_path, timeseries_url=None, equiv_results=None
-):
-    """Generate a comprehensive HTML report comparing all benchmarks."""
-
-    tool_names = list(summaries.keys())
+def _geomean_cell_html(compare_geo, baseline_geo):
+    """Return (content, style) for a geomean cell of the HTML geomean table.
 
-    # Helper function to extract category from benchmark data
-    def get_category(benchmark_name, summaries):
-        """Extract category from benchmark data (direct field or parsed from path)."""
-        for tool_name, summary in summaries.items():
-            benchmarks = summary.get("benchmarks", {})
-            if benchmark_name in benchmarks:
-                benchmark_data = benchmarks[benchmark_name]
-                category = benchmark_data.get("category", "Other")
-                return category
-        return "Other"
-
-    # Group benchmarks by category
-    benchmarks_by_category = {}
-    for benchmark_name in all_benchmarks:
-        category = get_category(benchmark_name, summaries)
-        if category not in benchmarks_by_category:
-            benchmarks_by_category[category] = []
-        benchmarks_by_category[category].append(benchmark_name)
-
-    # Sort categories and benchmarks within each category
-    sorted_categories = sorted(benchmarks_by_category.keys())
-
-    html = (
-        """<!DOCTYPE html>
+    The geomeans are 0 when a tool has no data, in which case the value is
+    shown without a difference. Lower is better.
+    """
+    if baseline_geo <= 0:
+        return f"{compare_geo:.1f}", ""
+    diff = compare_geo - baseline_geo
+    abs_pct = abs(diff / baseline_geo * 100)
+    ratio_pct = (compare_geo / baseline_geo - 1) * 100
+    content = f"{compare_geo:.1f} <span class='diff'>({ratio_pct:+.1f}%)</span>"
+    # Skip coloring if difference is nearly zero (< 0.01%)
+    if abs_pct < 0.01:
+        return content, ""
+    return content, background_style(diff < 0, min(abs_pct / 20.0, 1.0))
+
+
+# Static head of the HTML report, up to and including the summary box, filled
+# in once per report by generate_html_report().
+_HTML_HEAD = string.Template(
+    """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -937,42 +1264,38 @@ def generate_html_report(
         }
         
         function generateGeomeanMarkdown() {
-            const tool1 = '"""
-        + tool_names[0]
-        + """';
-            const tool2 = '"""
-        + tool_names[1]
-        + """';
+            const tool1 = '$tool1';
+            const tool2 = '$tool2';
             
             let md = '| Category | Metric | ' + tool1 + ' | ' + tool2 + ' |' + '\\n';
             md += '|----------|--------|' + '-'.repeat(tool1.length + 2) + '|' + '-'.repeat(tool2.length + 2) + '|' + '\\n';
             
-            // Get all rows from the geomean table
-            const rows = document.querySelectorAll('#geomean-table tbody tr');
+            // Get all cells from the geomean table in one query. Each row is
+            // a metric and two values, led by a category cell on the first row
+            // of each category.
+            const cells = document.querySelectorAll('#geomean-table tbody td');
             let currentCategory = '';
             
-            rows.forEach(row => {{
-                const cells = row.querySelectorAll('td');
-                if (cells.length === 0) return;
-                
+            let i = 0;
+            while (i + 2 < cells.length) {
                 // Check if this row has a category cell
-                const categoryCell = cells[0];
-                if (categoryCell.classList.contains('category-cell')) {{
-                    currentCategory = categoryCell.textContent.trim();
-                }}
+                if (cells[i].classList.contains('category-cell')) {
+                    currentCategory = cells[i].textContent.trim();
+                    i++;
+                }
                 
                 // Extract metric and values
-                const metricIdx = categoryCell.classList.contains('category-cell') ? 1 : 0;
-                const metric = cells[metricIdx].textContent.trim();
-                const val1 = cells[metricIdx + 1].textContent.trim();
-                const val2 = cells[metricIdx + 2].textContent.trim();
+                const metric = cells[i].textContent.trim();
+                const val1 = cells[i + 1].textContent.trim();
+                const val2 = cells[i + 2].textContent.trim();
+                i += 3;
                 
                 // Format category (only show on first metric)
-                const categoryText = (metric === 'Gates' || metric === '**Gates**') ? currentCategory : '';
+                const categoryText = metric === 'Gates' ? currentCategory : '';
                 
-                md += '| ' + categoryText + ' | ' + metric.replace(/\*\*/g, '') + ' | ' + 
-                      val1.replace(/\*\*/g, '') + ' | ' + val2.replace(/\*\*/g, '') + ' |' + '\\n';
-            }});
+                // Cell text is plain (bold comes from markup), so no '**' to strip.
+                md += '| ' + categoryText + ' | ' + metric + ' | ' + val1 + ' | ' + val2 + ' |' + '\\n';
+            }
             
             console.log('Generated markdown:');
             console.log(md);
@@ -985,54 +1308,95 @@ def generate_html_report(
     <div class="container">
         <h1>Synthesis Benchmark Comparison Report</h1>
 
-        """
-        + (
-            f'<nav><a href="report.html" class="active">Latest Report</a>'
-            f'<a href="{escape(timeseries_url)}">History</a>'
-            f'<a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">GitHub</a></nav>'
-            if timeseries_url
-            else '<nav><a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">GitHub</a></nav>'
-        )
-        + """
+        $nav
 
         <div class="summary">
-            <div class="summary-line"><strong>Tools Compared:</strong> """
-        + escape(", ".join(tool_names))
-        + """</div>
-            <div class="summary-line"><strong>Tool Versions:</strong> """
-        + escape(
-            ", ".join(
-                [
-                    f"{tool} v{summaries[tool].get('version', 'unknown')}"
-                    for tool in tool_names
-                ]
-            )
-        )
-        + """</div>
-            <div class="summary-line"><strong>Total Benchmarks:</strong> """
-        + str(len(all_benchmarks))
-        + """</div>
-            <div class="summary-line"><strong>Categories:</strong> """
-        + str(len(sorted_categories))
-        + """</div>
-            <div class="summary-line"><strong>Generated:</strong> """
-        + escape(summaries[tool_names[0]].get("timestamp", "N/A"))
-        + """</div>
+            <div class="summary-line"><strong>Tools Compared:</strong> $tools</div>
+            <div class="summary-line"><strong>Tool Versions:</strong> $versions</div>
+            <div class="summary-line"><strong>Total Benchmarks:</strong> $total_benchmarks</div>
+            <div class="summary-line"><strong>Categories:</strong> $num_categories</div>
+            <div class="summary-line"><strong>Generated:</strong> $generated</div>
         </div>
 """
+)
+
+_HTML_FOOT = """
+        <div class="footer">
+            Generated by <a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">circt-synth-tracker</a> compare-results
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Geometric mean table rows, filled with %-formatting: the category cell
+# (empty after the first row of a group), metric name, baseline and compare
+# values, and the compare cell style.
+_GEOMEAN_OVERALL_ROW = """
+                <tr style='background-color: #e3f2fd;'>
+                    %s
+                    <td><strong>%s</strong></td>
+                    <td class='metric'><strong>%.1f</strong></td>
+                    <td class='metric'%s><strong>%s</strong></td>
+                </tr>
+"""
+
+_GEOMEAN_CATEGORY_ROW = """
+                <tr>
+                    %s
+                    <td>%s</td>
+                    <td class='metric'>%.1f</td>
+                    <td class='metric'%s>%s</td>
+                </tr>
+"""
+
+
+def _html_report_fragments(summaries, index, timeseries_url, equiv_results):
+    """Yield the HTML report for :func:`generate_html_report` in fragments."""
+
+    tool_names = list(summaries.keys())
+    tool_bms = {tool: summaries[tool].get("benchmarks", {}) for tool in tool_names}
+
+    # Group benchmarks by category, sorted
+    benchmarks_by_category = _group_by_category(index)
+    sorted_categories = tuple(benchmarks_by_category)
+
+    yield (
+        _HTML_HEAD.substitute(
+            tool1=tool_names[0],
+            tool2=tool_names[1],
+            nav=(
+                f'<nav><a href="report.html" class="active">Latest Report</a>'
+                f'<a href="{escape(timeseries_url)}">History</a>'
+                f'<a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">GitHub</a></nav>'
+                if timeseries_url
+                else '<nav><a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">GitHub</a></nav>'
+            ),
+            tools=escape(", ".join(tool_names)),
+            versions=escape(
+                ", ".join(
+                    [
+                        f"{tool} v{summaries[tool].get('version', 'unknown')}"
+                        for tool in tool_names
+                    ]
+                )
+            ),
+            total_benchmarks=len(index),
+            num_categories=len(sorted_categories),
+            generated=escape(summaries[tool_names[0]].get("timestamp", "N/A")),
+        )
     )
 
     # Bar charts + outlier table (only for 2-tool comparison)
     if len(tool_names) == 2:
-        html += _bar_chart_section(
-            summaries, sorted_categories, benchmarks_by_category, tool_names
-        )
-        html += _outlier_table_section(
+        pairs = _paired_metric_values(
             summaries, sorted_categories, benchmarks_by_category, tool_names
         )
+        yield _bar_chart_section(pairs, tool_names)
+        yield _outlier_table_section(pairs, tool_names)
 
     # Generate comparison table
-    html += """
+    yield """
         <h2>Benchmark Comparison</h2>
         <table>
             <thead>
@@ -1044,57 +1408,172 @@ def generate_html_report(
     tools_with_tv = [
         t
         for t in tool_names
-        if any(
-            summaries[t].get("benchmarks", {}).get(b, {}).get("tv_status")
-            for b in all_benchmarks
-        )
+        if any(entry["by_tool"].get(t, {}).get("tv_status") for entry in index.values())
     ]
 
     # Add headers for each tool
     for tool in tool_names:
         colspan = 7 if tool in tools_with_tv else 6
-        html += f"                    <th class='tool-column' colspan='{colspan}'>{escape(tool)}</th>\n"
+        yield (
+            f"                    <th class='tool-column' colspan='{colspan}'>{_escape_name(tool)}</th>\n"
+        )
     if equiv_results is not None:
-        html += "                    <th>CEC</th>\n"
+        yield "                    <th>CEC</th>\n"
 
-    html += """
+    yield """
                 </tr>
                 <tr>
                     <th></th>
 """
 
     # Sub-headers for metrics
+    metric_headers = (
+        "                    "
+        + "".join(f"<th class='metric'>{label}</th>" for label in _METRIC_LABELS)
+        + "\n"
+    )
     for tool in tool_names:
-        html += "                    <th class='metric'>Gates</th><th class='metric'>Depth</th><th class='metric'>Area (ASAP7)</th><th class='metric'>Delay (ASAP7)</th><th class='metric'>Area (Sky130)</th><th class='metric'>Delay (Sky130)</th>\n"
+        yield metric_headers
         if tool in tools_with_tv:
-            html += "                    <th class='metric'>SMT TV (bitwuzla)</th>\n"
+            yield "                    <th class='metric'>SMT TV (bitwuzla)</th>\n"
     if equiv_results is not None:
-        html += "                    <th></th>\n"
+        yield "                    <th></th>\n"
 
-    html += """
+    yield """
                 </tr>
             </thead>
             <tbody>
 """
 
+    # Baseline for relative differences (first tool)
+    baseline_tool = tool_names[0]
+
+    # Per-tool metric cells, each filled with a (style, content) pair
+    metric_cells_template = "                    <td class='metric'{}>{}</td>\n" * len(
+        _METRIC_KEYS
+    )
+
+    def baseline_cells(result):
+        """Return the (style, content) pairs for the baseline tool's cells."""
+        cells = []
+        for key in _METRIC_KEYS:
+            cells += ("", str(result.get(key, "N/A")))
+        return cells
+
+    # Cells for a tool without this benchmark: every metric is N/A
+    missing_cells = ["", "N/A"] * len(_METRIC_KEYS)
+    no_tv_cell = "<td style='text-align:center; color:#aaa'>—</td>"
+
+    def compare_cells(result, baselines):
+        """Return the (style, content) pairs for a tool compared to baseline."""
+        cells = []
+        for key, baseline in zip(_METRIC_KEYS, baselines):
+            value = result.get(key, "N/A")
+            try:
+                content, style = _compare_metric_cell(value, baseline)
+            except TypeError:  # unhashable metric value
+                content, style = _compare_metric_cell.__wrapped__(value, baseline)
+            cells += (style, content)
+        return cells
+
+    tv_icons = {
+        "equiv": "✔",
+        "non-equiv": "✘",
+        "timeout": "⏱",
+        "error": "⚠",
+    }
+
+    def _tv_tip_span(header, results):
+        if not results:
+            return f"<span class='tv-tip'>{escape(header)}</span>"
+        lines = (
+            header
+            + "\n"
+            + "\n".join(
+                f"{tv_icons.get(r['status'], '?')} {r['from']} -> {r['to']}"
+                for r in results
+            )
+        )
+        return f"<span class='tv-tip'>{escape(lines)}</span>"
+
+    def tv_cell(result):
+        """Return the SMT TV cell for one tool's result."""
+        tv_status = result.get("tv_status")
+        tv_verified = result.get("tv_verified")
+        tv_total = result.get("tv_total")
+        tv_results_list = result.get("tv_results", [])
+        frac = (
+            f" {tv_verified}/{tv_total}"
+            if tv_verified is not None and tv_total is not None
+            else ""
+        )
+        has_timeout = any(
+            r.get("status") in ("timeout", "error") for r in tv_results_list
+        )
+
+        if tv_status == "pass" and not has_timeout:
+            header = f"All {tv_total} transformations verified equiv"
+            return f"<td class='tv-cell' style='background:rgb(200,255,200)'>✔{frac}{_tv_tip_span(header, tv_results_list)}</td>"
+        elif tv_status == "pass":  # pass but with timeouts
+            header = (
+                f"Partially verified ({tv_verified}/{tv_total} equiv, rest timed out)"
+            )
+            return f"<td class='tv-cell' style='background:rgb(255,235,180)'>~{frac}{_tv_tip_span(header, tv_results_list)}</td>"
+        elif tv_status == "fail":
+            header = f"NON-EQUIV detected ({tv_verified}/{tv_total} equiv)"
+            return f"<td class='tv-cell' style='background:rgb(255,200,200)'>✘ NON-EQUIV{frac}{_tv_tip_span(header, tv_results_list)}</td>"
+        elif tv_status == "error":
+            only_timeouts = all(
+                r.get("status") in ("equiv", "timeout") for r in tv_results_list
+            )
+            if only_timeouts:
+                header = f"Timeout ({tv_verified}/{tv_total} equiv)"
+                return f"<td class='tv-cell' style='background:rgb(255,235,180)'>⏱{frac}{_tv_tip_span(header, tv_results_list)}</td>"
+            header = f"Tool error ({tv_verified}/{tv_total} equiv)"
+            return f"<td class='tv-cell' style='background:rgb(255,235,180)'>⚠{frac}{_tv_tip_span(header, tv_results_list)}</td>"
+        return no_tv_cell
+
+    # CEC cell for each equivalence status
+    equiv_cells = {
+        "equiv": "<td style='text-align:center; background:rgb(200,255,200)'>✔ EQUIV</td>",
+        "non-equiv": "<td style='text-align:center; background:rgb(255,200,200)'>✘ NON-EQUIV</td>",
+        "timeout": "<td style='text-align:center; background:rgb(255,235,180)'>⏱ TIMEOUT</td>",
+        "error": "<td style='text-align:center; background:rgb(255,235,180)'>ERR</td>",
+    }
+    no_equiv_cell = "<td style='text-align:center; color:#aaa'>—</td>"
+
+    # Every benchmark row has the same shape for the whole report, so build
+    # one template for it: the name cell, each tool's metric cells (plus a TV
+    # cell for tools with TV data) and the optional CEC cell.
+    row_tools = [(tool, tool in tools_with_tv) for tool in tool_names]
+    row_template = (
+        "                <tr>\n                    <td class='benchmark-name'>{}</td>\n"
+    )
+    for _, has_tv in row_tools:
+        row_template += metric_cells_template
+        if has_tv:
+            row_template += "                    {}\n"
+    if equiv_results is not None:
+        row_template += "                    {}\n"
+    row_template += "                </tr>\n"
+
+    # Category header rows span every column
+    num_columns = 1 + (len(tool_names) * 6) + len(tools_with_tv)
+    if equiv_results is not None:
+        num_columns += 1
+    category_row_template = (
+        "                <tr>\n"
+        f"                    <td colspan='{num_columns}' class='category-header'>📁 {{}}</td>\n"
+        "                </tr>\n"
+    )
+
     # Add rows for each benchmark, grouped by category
     for category in sorted_categories:
-        # Add category header row
-        num_columns = 1 + (len(tool_names) * 6) + len(tools_with_tv)
-        if equiv_results is not None:
-            num_columns += 1
-        html += "                <tr>\n"
-        html += f"                    <td colspan='{num_columns}' class='category-header'>📁 {category}</td>\n"
-        html += "                </tr>\n"
+        yield category_row_template.format(_escape_name(category))
 
         # Add benchmarks in this category
-        for benchmark_name in sorted(benchmarks_by_category[category]):
-            comparison = {}
-
-            for tool_name, summary in summaries.items():
-                benchmarks = summary.get("benchmarks", {})
-                if benchmark_name in benchmarks:
-                    comparison[tool_name] = benchmarks[benchmark_name]
+        for benchmark_name in benchmarks_by_category[category]:
+            comparison = index[benchmark_name]["by_tool"]
 
             if len(comparison) < 2:
                 continue
@@ -1104,152 +1583,48 @@ def generate_html_report(
                 bname_cell = f'<a href="{escape(src_url)}" target="_blank" style="color:inherit">{escape(benchmark_name)}</a>'
             else:
                 bname_cell = escape(benchmark_name)
-            html += "                <tr>\n"
-            html += (
-                f"                    <td class='benchmark-name'>{bname_cell}</td>\n"
-            )
+            row = [bname_cell]
 
-            # Get baseline (first tool)
-            baseline_tool = tool_names[0]
             baseline_result = comparison.get(baseline_tool, {})
-            baseline_gates = baseline_result.get("gates", 0)
-            baseline_depth = baseline_result.get("depth", 0)
-            baseline_area_asap7 = baseline_result.get("area_asap7", 0)
-            baseline_delay_asap7 = baseline_result.get("delay_asap7", 0)
-            baseline_area_sky130 = baseline_result.get("area_sky130", 0)
-            baseline_delay_sky130 = baseline_result.get("delay_sky130", 0)
-            for tool in tool_names:
-                result = comparison.get(tool, {})
-                gates = result.get("gates", "N/A")
-                depth = result.get("depth", "N/A")
-                area_asap7 = result.get("area_asap7", "N/A")
-                delay_asap7 = result.get("delay_asap7", "N/A")
-                area_sky130 = result.get("area_sky130", "N/A")
-                delay_sky130 = result.get("delay_sky130", "N/A")
-
-                def format_metric(value, baseline, lower_is_better=True):
-                    if value == "N/A" or not baseline or tool == baseline_tool:
-                        return (str(value), "")  # (content, style)
-                    return format_metric_cell_html(
-                        value,
-                        baseline,
-                        lower_is_better=lower_is_better,
-                        line_break=True,
-                    )
-
-                # Format each metric (lower is better for all these metrics)
-                gates_content, gates_style = format_metric(
-                    gates, baseline_gates, lower_is_better=True
-                )
-                depth_content, depth_style = format_metric(
-                    depth, baseline_depth, lower_is_better=True
-                )
-                area_asap7_content, area_asap7_style = format_metric(
-                    area_asap7, baseline_area_asap7, lower_is_better=True
-                )
-                delay_asap7_content, delay_asap7_style = format_metric(
-                    delay_asap7, baseline_delay_asap7, lower_is_better=True
-                )
-                area_sky130_content, area_sky130_style = format_metric(
-                    area_sky130, baseline_area_sky130, lower_is_better=True
-                )
-                delay_sky130_content, delay_sky130_style = format_metric(
-                    delay_sky130, baseline_delay_sky130, lower_is_better=True
-                )
-                html += f"                    <td class='metric'{gates_style}>{gates_content}</td>\n"
-                html += f"                    <td class='metric'{depth_style}>{depth_content}</td>\n"
-                html += f"                    <td class='metric'{area_asap7_style}>{area_asap7_content}</td>\n"
-                html += f"                    <td class='metric'{delay_asap7_style}>{delay_asap7_content}</td>\n"
-                html += f"                    <td class='metric'{area_sky130_style}>{area_sky130_content}</td>\n"
-                html += f"                    <td class='metric'{delay_sky130_style}>{delay_sky130_content}</td>\n"
-
-                if tool in tools_with_tv:
-                    tv_status = result.get("tv_status")
-                    tv_verified = result.get("tv_verified")
-                    tv_total = result.get("tv_total")
-                    tv_results_list = result.get("tv_results", [])
-                    frac = (
-                        f" {tv_verified}/{tv_total}"
-                        if tv_verified is not None and tv_total is not None
-                        else ""
-                    )
-                    has_timeout = any(
-                        r.get("status") in ("timeout", "error") for r in tv_results_list
-                    )
-
-                    def _tv_tip_span(header, results):
-                        if not results:
-                            return f"<span class='tv-tip'>{escape(header)}</span>"
-                        icons = {
-                            "equiv": "✔",
-                            "non-equiv": "✘",
-                            "timeout": "⏱",
-                            "error": "⚠",
-                        }
-                        lines = (
-                            header
-                            + "\n"
-                            + "\n".join(
-                                f"{icons.get(r['status'], '?')} {r['from']} -> {r['to']}"
-                                for r in results
-                            )
-                        )
-                        return f"<span class='tv-tip'>{escape(lines)}</span>"
-
-                    if tv_status == "pass" and not has_timeout:
-                        header = f"All {tv_total} transformations verified equiv"
-                        tv_cell = f"<td class='tv-cell' style='background:rgb(200,255,200)'>✔{frac}{_tv_tip_span(header, tv_results_list)}</td>"
-                    elif tv_status == "pass":  # pass but with timeouts
-                        header = f"Partially verified ({tv_verified}/{tv_total} equiv, rest timed out)"
-                        tv_cell = f"<td class='tv-cell' style='background:rgb(255,235,180)'>~{frac}{_tv_tip_span(header, tv_results_list)}</td>"
-                    elif tv_status == "fail":
-                        header = f"NON-EQUIV detected ({tv_verified}/{tv_total} equiv)"
-                        tv_cell = f"<td class='tv-cell' style='background:rgb(255,200,200)'>✘ NON-EQUIV{frac}{_tv_tip_span(header, tv_results_list)}</td>"
-                    elif tv_status == "error":
-                        only_timeouts = all(
-                            r.get("status") in ("equiv", "timeout")
-                            for r in tv_results_list
-                        )
-                        if only_timeouts:
-                            header = f"Timeout ({tv_verified}/{tv_total} equiv)"
-                            tv_cell = f"<td class='tv-cell' style='background:rgb(255,235,180)'>⏱{frac}{_tv_tip_span(header, tv_results_list)}</td>"
-                        else:
-                            header = f"Tool error ({tv_verified}/{tv_total} equiv)"
-                            tv_cell = f"<td class='tv-cell' style='background:rgb(255,235,180)'>⚠{frac}{_tv_tip_span(header, tv_results_list)}</td>"
-                    else:
-                        tv_cell = "<td style='text-align:center; color:#aaa'>—</td>"
-                    html += f"                    {tv_cell}\n"
+            baselines = [baseline_result.get(key, 0) for key in _METRIC_KEYS]
+            for tool, has_tv in row_tools:
+                result = comparison.get(tool)
+                if not result:
+                    row += missing_cells
+                    if has_tv:
+                        row.append(no_tv_cell)
+                    continue
+
+                # The baseline tool's cells are plain values; only the other
+                # tools are diffed against it.
+                if tool == baseline_tool:
+                    row += baseline_cells(result)
+                else:
+                    row += compare_cells(result, baselines)
+                if has_tv:
+                    row.append(tv_cell(result))
 
             if equiv_results is not None:
                 status = equiv_results.get(benchmark_name)
-                if status == "equiv":
-                    equiv_cell = "<td style='text-align:center; background:rgb(200,255,200)'>✔ EQUIV</td>"
-                elif status == "non-equiv":
-                    equiv_cell = "<td style='text-align:center; background:rgb(255,200,200)'>✘ NON-EQUIV</td>"
-                elif status == "timeout":
-                    equiv_cell = "<td style='text-align:center; background:rgb(255,235,180)'>⏱ TIMEOUT</td>"
-                elif status == "error":
-                    equiv_cell = "<td style='text-align:center; background:rgb(255,235,180)'>ERR</td>"
-                else:
-                    equiv_cell = "<td style='text-align:center; color:#aaa'>—</td>"
-                html += f"                    {equiv_cell}\n"
+                row.append(equiv_cells.get(status, no_equiv_cell))
 
-            html += "                </tr>\n"
+            yield row_template.format(*row)
 
-    html += """
+    yield """
             </tbody>
         </table>
 """
 
     # Add equivalence check summary section
     if equiv_results:
-        n_pass = sum(1 for s in equiv_results.values() if s == "equiv")
-        n_fail = sum(1 for s in equiv_results.values() if s == "non-equiv")
-        n_timeout = sum(1 for s in equiv_results.values() if s == "timeout")
-        n_err = sum(1 for s in equiv_results.values() if s == "error")
-        n_skip = sum(1 for s in equiv_results.values() if s == "missing")
+        counts = Counter(equiv_results.values())
+        n_pass = counts["equiv"]
+        n_fail = counts["non-equiv"]
+        n_timeout = counts["timeout"]
+        n_err = counts["error"]
+        n_skip = counts["missing"]
         failed_names = [n for n, s in equiv_results.items() if s == "non-equiv"]
-        html += f"""
+        yield f"""
         <h2>Equivalence Check Summary</h2>
         <div class="summary">
             <div class="summary-line">✔ <strong>Equivalent:</strong> {n_pass}</div>
@@ -1260,14 +1635,15 @@ def generate_html_report(
         </div>
 """
         if failed_names:
-            html += "        <p><strong>Non-equiv benchmarks:</strong></p><ul>\n"
+            yield "        <p><strong>Non-equiv benchmarks:</strong></p><ul>\n"
             for name in sorted(failed_names):
-                html += f"            <li>{escape(name)}</li>\n"
-            html += "        </ul>\n"
+                yield f"            <li>{escape(name)}</li>\n"
+            yield "        </ul>\n"
 
     # Add geometric mean comparison table
     if len(tool_names) == 2:
-        html += """
+        yield (
+            """
         <h2>Geometric Mean Comparison
             <button class="copy-button" onclick="copyGeomeanAsMarkdown()">📋 Copy as Markdown</button>
             <span id="copy-feedback" class="copy-feedback">✓ Copied!</span>
@@ -1283,254 +1659,265 @@ def generate_html_report(
             </thead>
             <tbody>
 """.format(tool_names[0], tool_names[1])
+        )
 
         baseline_tool = tool_names[0]
         compare_tool = tool_names[1]
 
         # Helper function for geometric mean
-        def geo_mean(values):
-            valid_values = [v for v in values if v and v > 0]
-            if not valid_values:
-                return 0
-            return math.exp(sum(math.log(v) for v in valid_values) / len(valid_values))
-
-        # Calculate overall geometric mean across all benchmarks
-        all_baseline_benchmarks = list(
-            summaries[baseline_tool].get("benchmarks", {}).values()
-        )
-        all_compare_benchmarks = list(
-            summaries[compare_tool].get("benchmarks", {}).values()
-        )
-
-        metrics_data = [
-            ("Gates", "gates"),
-            ("Depth", "depth"),
-            ("Area (ASAP7)", "area_asap7"),
-            ("Delay (ASAP7)", "delay_asap7"),
-            ("Area (Sky130)", "area_sky130"),
-            ("Delay (Sky130)", "delay_sky130"),
-        ]
-
-        # Add overall row
-        first_row = True
+        def geo_mean(logs):
+            return _geo_mean_of_logs(logs) or 0
+
+        baseline_bms = tool_bms[baseline_tool]
+        compare_bms = tool_bms[compare_tool]
+
+        metrics_data = tuple(zip(_METRIC_LABELS, _METRIC_KEYS))
+        metric_keys = _METRIC_KEYS
+        baseline_logs = _log_columns(baseline_bms, metric_keys)
+        compare_logs = _log_columns(compare_bms, metric_keys)
+        category_of = _category_of(benchmarks_by_category)
+        baseline_cat_logs = _category_log_columns(baseline_logs, category_of)
+        compare_cat_logs = _category_log_columns(compare_logs, category_of)
+        # Categories each tool has at least one benchmark in
+        baseline_categories = {category_of.get(n) for n in baseline_bms}
+        compare_categories = {category_of.get(n) for n in compare_bms}
+
+        # Add overall row: geometric mean across all benchmarks. Rows are
+        # collected and emitted as one fragment with the closing tags.
+        rows = []
+        category_cell = f"<td rowspan='6' class='category-cell' style='background-color: #e3f2fd; font-weight: bold;'>Overall ({len(baseline_bms)} benchmarks)</td>"
         for metric_name, metric_key in metrics_data:
-            baseline_values = [b.get(metric_key, 0) for b in all_baseline_benchmarks]
-            compare_values = [b.get(metric_key, 0) for b in all_compare_benchmarks]
-
-            baseline_geo = geo_mean(baseline_values)
-            compare_geo = geo_mean(compare_values)
-
-            # Calculate background color for compare_geo cell
-            if baseline_geo > 0 and compare_geo != "N/A":
-                diff = compare_geo - baseline_geo
-                diff_pct = (diff / baseline_geo * 100) if baseline_geo > 0 else 0
-                abs_pct = abs(diff_pct)
-
-                ratio = compare_geo / baseline_geo
-                ratio_pct = (ratio - 1) * 100
-                compare_display = (
-                    f"{compare_geo:.1f} <span class='diff'>({ratio_pct:+.1f}%)</span>"
-                )
-
-                # Skip coloring if difference is nearly zero (< 0.01%)
-                if abs_pct < 0.01:
-                    compare_style = ""
-                else:
-                    is_better = diff < 0  # Lower is better
-
-                    if is_better:
-                        intensity = min(abs_pct / 20.0, 1.0)
-                        green_val = int(200 - (50 * intensity))
-                        compare_bg = f"rgb({green_val},255,{green_val})"
-                    else:
-                        intensity = min(abs_pct / 20.0, 1.0)
-                        red_val = int(200 - (50 * intensity))
-                        compare_bg = f"rgb(255,{red_val},{red_val})"
-                    compare_style = f" style='background-color: {compare_bg};'"
-            else:
-                compare_style = ""
-                compare_display = (
-                    f"{compare_geo:.1f}" if compare_geo != "N/A" else "N/A"
+            baseline_geo = geo_mean(list(baseline_logs[metric_key].values()))
+            compare_geo = geo_mean(list(compare_logs[metric_key].values()))
+            compare_display, compare_style = _geomean_cell_html(
+                compare_geo, baseline_geo
+            )
+            rows.append(
+                _GEOMEAN_OVERALL_ROW
+                % (
+                    category_cell,
+                    metric_name,
+                    baseline_geo,
+                    compare_style,
+                    compare_display,
                 )
-
-            category_cell = (
-                f"<td rowspan='6' class='category-cell' style='background-color: #e3f2fd; font-weight: bold;'>Overall ({len(all_baseline_benchmarks)} benchmarks)</td>"
-                if first_row
-                else ""
             )
-            html += f"""
-                <tr style='background-color: #e3f2fd;'>
-                    {category_cell}
-                    <td><strong>{metric_name}</strong></td>
-                    <td class='metric'><strong>{baseline_geo:.1f}</strong></td>
-                    <td class='metric'{compare_style}><strong>{compare_display}</strong></td>
-                </tr>
-"""
-            first_row = False
+            category_cell = ""
 
         for category in sorted_categories:
-            # Get benchmarks for this category from both tools
-            baseline_benchmarks = []
-            compare_benchmarks = []
-
-            for benchmark_name in benchmarks_by_category[category]:
-                if benchmark_name in summaries[baseline_tool].get("benchmarks", {}):
-                    baseline_benchmarks.append(
-                        summaries[baseline_tool]["benchmarks"][benchmark_name]
-                    )
-                if benchmark_name in summaries[compare_tool].get("benchmarks", {}):
-                    compare_benchmarks.append(
-                        summaries[compare_tool]["benchmarks"][benchmark_name]
-                    )
-
-            if not baseline_benchmarks or not compare_benchmarks:
+            # Skip categories missing from either tool
+            if (
+                category not in baseline_categories
+                or category not in compare_categories
+            ):
                 continue
 
             # Calculate per-category geometric means
-            first_row = True
+            category_cell = f"<td rowspan='6' class='category-cell benchmark-name'>{_escape_name(category)}</td>"
             for metric_name, metric_key in metrics_data:
-                baseline_values = [b.get(metric_key, 0) for b in baseline_benchmarks]
-                compare_values = [b.get(metric_key, 0) for b in compare_benchmarks]
-
-                baseline_geo = geo_mean(baseline_values)
-                compare_geo = geo_mean(compare_values)
-
-                # Calculate background color for compare_geo cell
-                if baseline_geo > 0 and compare_geo != "N/A":
-                    diff = compare_geo - baseline_geo
-                    diff_pct = (diff / baseline_geo * 100) if baseline_geo > 0 else 0
-                    abs_pct = abs(diff_pct)
-
-                    ratio = compare_geo / baseline_geo
-                    ratio_pct = (ratio - 1) * 100
-                    compare_display = f"{compare_geo:.1f} <span class='diff'>({ratio_pct:+.1f}%)</span>"
-
-                    # Skip coloring if difference is nearly zero (< 0.01%)
-                    if abs_pct < 0.01:
-                        compare_style = ""
-                    else:
-                        is_better = diff < 0  # Lower is better
-
-                        if is_better:
-                            intensity = min(abs_pct / 20.0, 1.0)
-                            green_val = int(200 - (50 * intensity))
-                            compare_bg = f"rgb({green_val},255,{green_val})"
-                        else:
-                            intensity = min(abs_pct / 20.0, 1.0)
-                            red_val = int(200 - (50 * intensity))
-                            compare_bg = f"rgb(255,{red_val},{red_val})"
-                        compare_style = f" style='background-color: {compare_bg};'"
-                else:
-                    compare_style = ""
-                    compare_display = (
-                        f"{compare_geo:.1f}" if compare_geo != "N/A" else "N/A"
+                baseline_geo = geo_mean(baseline_cat_logs[metric_key].get(category))
+                compare_geo = geo_mean(compare_cat_logs[metric_key].get(category))
+                compare_display, compare_style = _geomean_cell_html(
+                    compare_geo, baseline_geo
+                )
+                rows.append(
+                    _GEOMEAN_CATEGORY_ROW
+                    % (
+                        category_cell,
+                        metric_name,
+                        baseline_geo,
+                        compare_style,
+                        compare_display,
                     )
-
-                category_cell = (
-                    f"<td rowspan='6' class='category-cell benchmark-name'>{category}</td>"
-                    if first_row
-                    else ""
                 )
-                html += f"""
-                <tr>
-                    {category_cell}
-                    <td>{metric_name}</td>
-                    <td class='metric'>{baseline_geo:.1f}</td>
-                    <td class='metric'{compare_style}>{compare_display}</td>
-                </tr>
-"""
-                first_row = False
+                category_cell = ""
 
-        html += """
+        rows.append("""
             </tbody>
         </table>
-"""
+""")
+        yield "".join(rows)
 
-    html += """
-        <div class="footer">
-            Generated by <a href="https://github.com/uenoku/circt-synth-tracker" target="_blank">circt-synth-tracker</a> compare-results
-        </div>
-    </div>
-</body>
-</html>
-"""
+    yield _HTML_FOOT
+
+
+def generate_html_report(
+    summaries, index, output_path, timeseries_url=None, equiv_results=None
+):
+    """Generate a comprehensive HTML report comparing all benchmarks.
 
-    # Write HTML file
-    with open(output_path, "w") as f:
-        f.write(html)
+    *index* is the benchmark index from :func:`_build_index`, restricted to the
+    benchmarks to report.
+    """
+    # Stream the fragments through one large buffer instead of holding the
+    # whole report in memory.
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(
+            _html_report_fragments(summaries, index, timeseries_url, equiv_results)
+        )
 
     print(f"HTML report generated: {output_path}")
 
 
-def generate_json_report(summaries, all_benchmarks, output_path):
-    """Generate a comprehensive JSON report comparing all benchmarks."""
-    import json
+def _indented_json(obj, depth):
+    """Return *obj* as 2-space indented JSON bytes nested *depth* spaces deep."""
+    # JSON strings never contain raw newlines, so every newline starts a line.
+    return dumps(obj, indent=True).replace(b"\n", b"\n" + b" " * depth)
+
 
+def generate_json_report(summaries, index, output_path, comparisons=None):
+    """Generate a comprehensive JSON report comparing all benchmarks.
+
+    The report is written one benchmark at a time rather than built as a
+    single dict first, in the same 2-space indented layout as serializing
+    the whole report at once. *comparisons* is the result of
+    :func:`build_comparisons` and is computed from *index* if not given.
+    """
     tool_names = list(summaries.keys())
+    if comparisons is None:
+        comparisons = build_comparisons(index)
 
-    # Build comprehensive JSON structure
-    report = {
-        "metadata": {
-            "tools_compared": tool_names,
-            "total_benchmarks": len(all_benchmarks),
-            "generated": summaries[tool_names[0]].get("timestamp", "N/A"),
-        },
-        "benchmarks": {},
+    metadata = {
+        "tools_compared": tool_names,
+        "total_benchmarks": len(index),
+        "generated": summaries[tool_names[0]].get("timestamp", "N/A"),
     }
 
-    for benchmark_name in sorted(all_benchmarks):
-        comparison = {}
+    # Write JSON file
+    count = 0
+    with open(output_path, "wb", buffering=1 << 16) as f:
+        f.write(b'{\n  "metadata": ' + _indented_json(metadata, 2))
+        f.write(b',\n  "benchmarks": {')
+        for benchmark_name, comparison in comparisons.items():
+            f.write(b",\n    " if count else b"\n    ")
+            f.write(dumps(benchmark_name) + b": ")
+            f.write(_indented_json(comparison, 4))
+            count += 1
+        f.write(b"\n  }\n}" if count else b"}\n}")
 
-        for tool_name, summary in summaries.items():
-            benchmarks = summary.get("benchmarks", {})
-            if benchmark_name in benchmarks:
-                comparison[tool_name] = benchmarks[benchmark_name]
+    print(f"JSON report generated: {output_path}")
 
-        if len(comparison) >= 2:  # Include benchmarks with at least 2 tools
-            report["benchmarks"][benchmark_name] = comparison
 
-    # Write JSON file
-    with open(output_path, "w") as f:
-        json.dump(report, f, indent=2)
+# Table headers and status icons of the Markdown report's per-benchmark details.
+_MD_DETAIL_HEADERS = [
+    "Tool",
+    "Gates",
+    "Depth",
+    "Area (ASAP7)",
+    "Delay (ASAP7)",
+    "Area (Sky130)",
+    "Delay (Sky130)",
+]
+_MD_DETAIL_HEADERS_TV = _MD_DETAIL_HEADERS + ["SMT TV (bitwuzla)"]
+_MD_TV_ICONS = {"pass": "✔", "fail": "✘", "error": "⚠", None: "—"}
+_MD_CEC_ICONS = {
+    "equiv": "✔",
+    "non-equiv": "✘",
+    "timeout": "⏱",
+    "error": "⚠",
+    "missing": "—",
+}
+_MD_TV_STEP_ICONS = {
+    "equiv": "✔",
+    "non-equiv": "✘",
+    "timeout": "⏱",
+    "error": "⚠",
+}
+
+# Below this many benchmarks, starting worker processes costs more than
+# formatting the Markdown details serially.
+_MD_PARALLEL_MIN_BENCHMARKS = 2000
+
+
+def _markdown_benchmark_detail(task):
+    """Return the Markdown detail block for one benchmark.
+
+    *task* is ``(category, benchmark_name, comparison, tool_names,
+    cec_status)``; the first tool in *tool_names* is the baseline. This is a
+    module-level function so that it can run in a worker process.
+    """
+    category, bname, comparison, tool_names, cec_status = task
+    baseline_tool = tool_names[0]
+    baseline_result = comparison.get(baseline_tool, {})
+    baselines = [baseline_result.get(key) for key in _METRIC_KEYS]
+
+    tools_with_tv_md = [
+        t for t in tool_names if comparison.get(t, {}).get("tv_status") is not None
+    ]
+    headers = _MD_DETAIL_HEADERS_TV if tools_with_tv_md else _MD_DETAIL_HEADERS
+    tool_values = [
+        [comparison.get(tool, {}).get(key) for key in _METRIC_KEYS]
+        for tool in tool_names
+    ]
+    # When every tool matches the baseline, all non-baseline rows have the
+    # same cells, so they are formatted only once.
+    same_cells = None
+    if all(_same_metric_values(values, baselines) for values in tool_values):
+        same_cells = [_md_report_cell(v, v) for v in baselines]
+    rows = []
+    for tool, values in zip(tool_names, tool_values):
+        result = comparison.get(tool, {})
+        if tool == baseline_tool:
+            row = [tool, *[_md_value_cell(v) for v in values]]
+        elif same_cells is not None:
+            row = [tool, *same_cells]
+        else:
+            row = [tool]
+            for value, baseline in zip(values, baselines):
+                row.append(_md_report_cell(value, baseline))
+        if tools_with_tv_md:
+            tv_status = result.get("tv_status")
+            row.append(_MD_TV_ICONS.get(tv_status, tv_status or "—"))
+        rows.append(row)
+
+    src_url = _benchmark_source_url(bname, category)
+    bname_md = f"[{bname}]({src_url})" if src_url else bname
+    parts = [f"\n**{bname_md}**{cec_status}\n\n", _render_github_md(headers, rows)]
+    parts.append("\n")
+
+    # Per-transformation TV detail
+    for tool in tools_with_tv_md:
+        tv_results_list = comparison.get(tool, {}).get("tv_results", [])
+        if tv_results_list:
+            parts.append(f"\n_SMT Translation Validation ({tool})_\n\n")
+            tv_rows = [
+                [_MD_TV_STEP_ICONS.get(r["status"], r["status"]), r["from"], r["to"]]
+                for r in tv_results_list
+            ]
+            parts.append(_render_github_md(["", "From", "To"], tv_rows) + "\n")
+    return "".join(parts)
 
-    print(f"JSON report generated: {output_path}")
+
+def _map_markdown_details(tasks, jobs=None):
+    """Format the Markdown detail blocks for *tasks*, in order.
+
+    Large suites are spread over up to *jobs* worker processes (default:
+    number of available CPU cores).
+    """
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    if workers > 1 and len(tasks) >= _MD_PARALLEL_MIN_BENCHMARKS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_markdown_benchmark_detail, tasks, chunksize=64))
+    return [_markdown_benchmark_detail(task) for task in tasks]
 
 
 def generate_markdown_report(
-    summaries, all_benchmarks, output_path, equiv_results=None
+    summaries, index, output_path, equiv_results=None, comparisons=None, jobs=None
 ):
-    """Generate a Markdown report with a summary geomean table and collapsible per-benchmark details."""
-    from tabulate import tabulate
+    """Generate a Markdown report with a summary geomean table and collapsible per-benchmark details.
 
+    With many benchmarks, the per-benchmark details are formatted in up to
+    *jobs* worker processes.
+    """
     tool_names = list(summaries.keys())
+    if comparisons is None:
+        comparisons = build_comparisons(index)
 
-    # Helper: geometric mean
-    def geo_mean(values):
-        valid = [v for v in values if v and v > 0]
-        if not valid:
-            return None
-        return math.exp(sum(math.log(v) for v in valid) / len(valid))
-
-    metrics_def = [
-        ("Gates", "gates"),
-        ("Depth", "depth"),
-        ("Area (ASAP7)", "area_asap7"),
-        ("Delay (ASAP7)", "delay_asap7"),
-        ("Area (Sky130)", "area_sky130"),
-        ("Delay (Sky130)", "delay_sky130"),
-    ]
+    metrics_def = tuple(zip(_METRIC_LABELS, _METRIC_KEYS))
 
-    # Group benchmarks by category
-    benchmarks_by_category = {}
-    for bname in all_benchmarks:
-        cat = "Other"
-        for summary in summaries.values():
-            bd = summary.get("benchmarks", {}).get(bname)
-            if bd:
-                cat = bd.get("category", "Other")
-                break
-        benchmarks_by_category.setdefault(cat, []).append(bname)
-    sorted_categories = sorted(benchmarks_by_category.keys())
+    # Group benchmarks by category, sorted
+    benchmarks_by_category = _group_by_category(index)
+    sorted_categories = tuple(benchmarks_by_category)
 
     if len(tool_names) == 2:
         baseline_tool, compare_tool = tool_names[0], tool_names[1]
@@ -1551,38 +1938,36 @@ def generate_markdown_report(
         geomean_rows = []
 
         # Overall row
-        all_base = list(summaries[baseline_tool].get("benchmarks", {}).values())
-        all_cmp = list(summaries[compare_tool].get("benchmarks", {}).values())
+        all_base = summaries[baseline_tool].get("benchmarks", {})
+        all_cmp = summaries[compare_tool].get("benchmarks", {})
+        metric_keys = _METRIC_KEYS
+        base_logs = _log_columns(all_base, metric_keys)
+        cmp_logs = _log_columns(all_cmp, metric_keys)
+        category_of = _category_of(benchmarks_by_category)
+        base_cat_logs = _category_log_columns(base_logs, category_of)
+        cmp_cat_logs = _category_log_columns(cmp_logs, category_of)
+        base_categories = {category_of.get(bn) for bn in all_base}
+        cmp_categories = {category_of.get(bn) for bn in all_cmp}
         overall_label = f"**Overall** ({len(all_base)} benchmarks)"
         for i, (mname, mkey) in enumerate(metrics_def):
-            bg = geo_mean([b.get(mkey) for b in all_base])
-            cg = geo_mean([b.get(mkey) for b in all_cmp])
+            bg = _geo_mean_of_logs(list(base_logs[mkey].values()))
+            cg = _geo_mean_of_logs(list(cmp_logs[mkey].values()))
             b_str, c_str = fmt_geo(bg, cg)
             cat_cell = overall_label if i == 0 else ""
             geomean_rows.append([cat_cell, mname, b_str, c_str])
 
         # Per-category rows
         for category in sorted_categories:
-            base_bds = [
-                summaries[baseline_tool]["benchmarks"][bn]
-                for bn in benchmarks_by_category[category]
-                if bn in summaries[baseline_tool].get("benchmarks", {})
-            ]
-            cmp_bds = [
-                summaries[compare_tool]["benchmarks"][bn]
-                for bn in benchmarks_by_category[category]
-                if bn in summaries[compare_tool].get("benchmarks", {})
-            ]
-            if not base_bds or not cmp_bds:
+            if category not in base_categories or category not in cmp_categories:
                 continue
             for i, (mname, mkey) in enumerate(metrics_def):
-                bg = geo_mean([b.get(mkey) for b in base_bds])
-                cg = geo_mean([b.get(mkey) for b in cmp_bds])
+                bg = _geo_mean_of_logs(base_cat_logs[mkey].get(category))
+                cg = _geo_mean_of_logs(cmp_cat_logs[mkey].get(category))
                 b_str, c_str = fmt_geo(bg, cg)
                 cat_cell = category if i == 0 else ""
                 geomean_rows.append([cat_cell, mname, b_str, c_str])
 
-        geomean_table = tabulate(
+        geomean_table = _tabulate(
             geomean_rows, headers=geomean_headers, tablefmt="github"
         )
     else:
@@ -1596,40 +1981,40 @@ def generate_markdown_report(
         ver = summaries[t].get("version", "unknown")
         tool_ver_parts.append(f"{t} `{ver}`")
     timestamp = summaries[tool_names[0]].get("timestamp", "N/A")
-    markdown = (
+    # Collect sections in a list and join once when writing
+    parts = [
         f"**Tools:** {', '.join(tool_ver_parts)} | "
-        f"**Benchmarks:** {len(all_benchmarks)} | "
+        f"**Benchmarks:** {len(index)} | "
         f"**Generated:** {timestamp}\n\n"
-    )
+    ]
 
     # Geomean summary
     if geomean_table:
-        markdown += "### Summary (Geometric Mean)\n\n"
-        markdown += geomean_table + "\n\n"
+        parts.append("### Summary (Geometric Mean)\n\n")
+        parts.append(geomean_table + "\n\n")
 
     # SMT TV summary
-    all_tv_statuses = [
-        summary.get("benchmarks", {}).get(bname, {}).get("tv_status")
-        for summary in summaries.values()
-        for bname in all_benchmarks
-        if summary.get("benchmarks", {}).get(bname, {}).get("tv_status") is not None
-    ]
+    # TV statuses and failing benchmarks, collected in one pass over the index
+    all_tv_statuses = []
+    failed_tv = []
+    for bname, entry in index.items():
+        for bd in entry["by_tool"].values():
+            tv_status = bd.get("tv_status")
+            if tv_status is not None:
+                all_tv_statuses.append(tv_status)
+                if tv_status == "fail":
+                    failed_tv.append(bname)
+    failed_tv.sort()
     if all_tv_statuses:
         n_tv_pass = all_tv_statuses.count("pass")
         n_tv_fail = all_tv_statuses.count("fail")
         n_tv_error = all_tv_statuses.count("error")
-        markdown += "### SMT Translation Validation (bitwuzla)\n\n"
-        markdown += (
+        parts.append("### SMT Translation Validation (bitwuzla)\n\n")
+        parts.append(
             f"✔ Pass: {n_tv_pass} | ✘ Fail: {n_tv_fail} | ⚠ Error: {n_tv_error}\n\n"
         )
-        failed_tv = sorted(
-            bname
-            for summary in summaries.values()
-            for bname, bd in summary.get("benchmarks", {}).items()
-            if bd.get("tv_status") == "fail"
-        )
         if failed_tv:
-            markdown += (
+            parts.append(
                 "**Non-equivalent (TV):** "
                 + ", ".join(f"`{n}`" for n in failed_tv)
                 + "\n\n"
@@ -1637,147 +2022,54 @@ def generate_markdown_report(
 
     # CEC summary
     if equiv_results:
-        n_equiv = sum(1 for s in equiv_results.values() if s == "equiv")
-        n_nequiv = sum(1 for s in equiv_results.values() if s == "non-equiv")
-        n_timeout = sum(1 for s in equiv_results.values() if s == "timeout")
-        n_err = sum(1 for s in equiv_results.values() if s == "error")
-        n_miss = sum(1 for s in equiv_results.values() if s == "missing")
-        markdown += "### Equivalence Check (CEC)\n\n"
-        markdown += f"✔ Equivalent: {n_equiv} | ✘ Non-equiv: {n_nequiv} | ⏱ Timeout: {n_timeout} | ⚠ Error: {n_err} | — Skipped: {n_miss}\n\n"
+        counts = Counter(equiv_results.values())
+        n_equiv = counts["equiv"]
+        n_nequiv = counts["non-equiv"]
+        n_timeout = counts["timeout"]
+        n_err = counts["error"]
+        n_miss = counts["missing"]
+        parts.append("### Equivalence Check (CEC)\n\n")
+        parts.append(
+            f"✔ Equivalent: {n_equiv} | ✘ Non-equiv: {n_nequiv} | ⏱ Timeout: {n_timeout} | ⚠ Error: {n_err} | — Skipped: {n_miss}\n\n"
+        )
         failed = sorted(n for n, s in equiv_results.items() if s == "non-equiv")
         if failed:
-            markdown += (
+            parts.append(
                 "**Non-equivalent benchmarks:** "
                 + ", ".join(f"`{n}`" for n in failed)
                 + "\n\n"
             )
 
-    # Per-benchmark detail inside collapsible block
-    detail_lines = []
+    # Per-benchmark detail inside collapsible block. Benchmarks without a
+    # comparison are skipped once, here; the blocks are then placed by count.
+    tasks = []
+    tasks_per_category = []
     for category in sorted_categories:
-        detail_lines.append(f"\n#### {category}\n")
-        for bname in sorted(benchmarks_by_category[category]):
-            comparison = {}
-            for tname, summary in summaries.items():
-                bd = summary.get("benchmarks", {}).get(bname)
-                if bd:
-                    comparison[tname] = bd
-
-            if len(comparison) < 2:
+        n_tasks = len(tasks)
+        for bname in benchmarks_by_category[category]:
+            comparison = comparisons.get(bname)
+            if comparison is None:
                 continue
-
-            baseline_result = comparison.get(baseline_tool, {})
-
-            def fmt(value, baseline, tool):
-                if value is None or value == "N/A":
-                    return "-"
-                if not baseline or tool == baseline_tool:
-                    return str(value)
-                diff_pct = (value - baseline) / baseline * 100 if baseline > 0 else 0
-                sign = "+" if diff_pct > 0 else ""
-                return f"{value} ({sign}{diff_pct:.1f}%)"
-
-            tools_with_tv_md = [
-                t
-                for t in tool_names
-                if comparison.get(t, {}).get("tv_status") is not None
-            ]
-            headers = [
-                "Tool",
-                "Gates",
-                "Depth",
-                "Area (ASAP7)",
-                "Delay (ASAP7)",
-                "Area (Sky130)",
-                "Delay (Sky130)",
-            ]
-            if tools_with_tv_md:
-                headers.append("SMT TV (bitwuzla)")
-            rows = []
-            for tool in tool_names:
-                result = comparison.get(tool, {})
-                row = [
-                    tool,
-                    fmt(result.get("gates"), baseline_result.get("gates"), tool),
-                    fmt(result.get("depth"), baseline_result.get("depth"), tool),
-                    fmt(
-                        result.get("area_asap7"),
-                        baseline_result.get("area_asap7"),
-                        tool,
-                    ),
-                    fmt(
-                        result.get("delay_asap7"),
-                        baseline_result.get("delay_asap7"),
-                        tool,
-                    ),
-                    fmt(
-                        result.get("area_sky130"),
-                        baseline_result.get("area_sky130"),
-                        tool,
-                    ),
-                    fmt(
-                        result.get("delay_sky130"),
-                        baseline_result.get("delay_sky130"),
-                        tool,
-                    ),
-                ]
-                if tools_with_tv_md:
-                    tv_status = result.get("tv_status")
-                    tv_icons = {"pass": "✔", "fail": "✘", "error": "⚠", None: "—"}
-                    row.append(tv_icons.get(tv_status, tv_status or "—"))
-                rows.append(row)
-
             cec_status = ""
             if equiv_results and bname in equiv_results:
                 s = equiv_results[bname]
-                icon = {
-                    "equiv": "✔",
-                    "non-equiv": "✘",
-                    "timeout": "⏱",
-                    "error": "⚠",
-                    "missing": "—",
-                }.get(s, s)
-                cec_status = f" (CEC: {icon})"
-
-            src_url = _benchmark_source_url(bname, category)
-            bname_md = f"[{bname}]({src_url})" if src_url else bname
-            detail_lines.append(f"\n**{bname_md}**{cec_status}\n\n")
-            detail_lines.append(
-                tabulate(rows, headers=headers, tablefmt="github") + "\n"
-            )
+                cec_status = f" (CEC: {_MD_CEC_ICONS.get(s, s)})"
+            tasks.append((category, bname, comparison, tool_names, cec_status))
+        tasks_per_category.append(len(tasks) - n_tasks)
+    blocks = iter(_map_markdown_details(tasks, jobs))
 
-            # Per-transformation TV detail
-            tv_step_icons = {
-                "equiv": "✔",
-                "non-equiv": "✘",
-                "timeout": "⏱",
-                "error": "⚠",
-            }
-            for tool in tools_with_tv_md:
-                tv_results_list = comparison.get(tool, {}).get("tv_results", [])
-                if tv_results_list:
-                    detail_lines.append(f"\n_SMT Translation Validation ({tool})_\n\n")
-                    tv_rows = [
-                        [
-                            tv_step_icons.get(r["status"], r["status"]),
-                            r["from"],
-                            r["to"],
-                        ]
-                        for r in tv_results_list
-                    ]
-                    detail_lines.append(
-                        tabulate(tv_rows, headers=["", "From", "To"], tablefmt="github")
-                        + "\n"
-                    )
+    detail_lines = []
+    for category, n_tasks in zip(sorted_categories, tasks_per_category):
+        detail_lines.append(f"\n#### {category}\n")
+        detail_lines.extend(itertools.islice(blocks, n_tasks))
 
     if detail_lines:
-        markdown += "<details>\n<summary>Per-benchmark details</summary>\n"
-        markdown += "".join(detail_lines)
-        markdown += "\n</details>\n"
+        parts.append("<details>\n<summary>Per-benchmark details</summary>\n")
+        parts.extend(detail_lines)
+        parts.append("\n</details>\n")
 
-    # Write Markdown file
-    with open(output_path, "w") as f:
-        f.write(markdown)
+    # Write Markdown file, encoded once and handed to the OS in one write
+    Path(output_path).write_bytes("".join(parts).encode("utf-8"))
 
     print(f"Markdown report generated: {output_path}")
 
@@ -1794,15 +2086,22 @@ def display_comparison(comparison, benchmark_name, format_type, metric_filter=No
     if format_type == "table":
         display_table(comparison, metric_filter)
     elif format_type == "json":
-        import json
-
-        print(json.dumps(comparison, indent=2))
+        print(dumps(comparison, indent=True).decode())
     elif format_type == "markdown":
         display_markdown(comparison, metric_filter)
     elif format_type == "html":
         display_html(comparison, benchmark_name, metric_filter)
 
 
+def _get_with_fallback(result, key, fallback_key, default="N/A"):
+    """Return ``result[key]``, or ``result[fallback_key]`` if *key* is unset.
+
+    Only a missing or None value falls back, so a count of 0 is kept.
+    """
+    value = result.get(key)
+    return value if value is not None else result.get(fallback_key, default)
+
+
 def display_table(comparison, metric_filter=None):
     """Display comparison as a table."""
 
@@ -1822,21 +2121,19 @@ def display_table(comparison, metric_filter=None):
 
     for tool, result in sorted(comparison.items()):
         # Support both 'inputs'/'outputs' and 'num_inputs'/'num_outputs'
-        row = [
-            tool,
-            result.get("gates", "N/A"),
-            result.get("inputs") or result.get("num_inputs", "N/A"),
-            result.get("outputs") or result.get("num_outputs", "N/A"),
-            result.get("depth", "N/A"),
-            result.get("area_asap7", "N/A"),
-            result.get("delay_asap7", "N/A"),
-            result.get("area_sky130", "N/A"),
-            result.get("delay_sky130", "N/A"),
-        ]
-        rows.append(row)
+        rows.append(
+            [
+                tool,
+                result.get("gates", "N/A"),
+                _get_with_fallback(result, "inputs", "num_inputs"),
+                _get_with_fallback(result, "outputs", "num_outputs"),
+                # Depth and the cell-library metrics follow the I/O counts.
+                *[result.get(key, "N/A") for key in _METRIC_KEYS[1:]],
+            ]
+        )
 
     # Display table
-    print(tabulate(rows, headers=headers, tablefmt="grid"))
+    print(_tabulate(rows, headers=headers, tablefmt="grid"))
 
     # Calculate differences
     if len(rows) > 1:
@@ -1844,51 +2141,61 @@ def display_table(comparison, metric_filter=None):
         display_differences(comparison)
 
 
+# (metric key, section title) pairs reported by display_differences.
+_DIFF_METRICS = tuple(
+    (key, f"{title.capitalize()} comparison")
+    for key, title in (
+        ("gates", "gates"),
+        ("depth", "depth"),
+        ("area_asap7", "area (ASAP7)"),
+        ("delay_asap7", "delay (ASAP7)"),
+        ("area_sky130", "area (sky130)"),
+        ("delay_sky130", "delay (sky130)"),
+    )
+)
+
+
 def display_differences(comparison):
     """Display relative differences between tools."""
 
-    tools = list(comparison.keys())
+    tools = list(comparison)
     if len(tools) < 2:
         return
 
     base_tool = tools[0]
     base_result = comparison[base_tool]
+    others = [(tool, comparison[tool]) for tool in tools[1:]]
 
-    # Include technology-specific metric names
-    metrics = [
-        ("gates", "gates"),
-        ("depth", "depth"),
-        ("area_asap7", "area (ASAP7)"),
-        ("delay_asap7", "delay (ASAP7)"),
-        ("area_sky130", "area (sky130)"),
-        ("delay_sky130", "delay (sky130)"),
-    ]
-
-    for metric_key, metric_display in metrics:
+    for metric_key, title in _DIFF_METRICS:
         base_value = base_result.get(metric_key)
         if base_value is None or base_value == 0:
             continue
 
-        print(
-            f"\n{metric_display.capitalize().replace('_', ' ')} comparison (relative to {base_tool}):"
-        )
-        for tool in tools[1:]:
-            tool_value = comparison[tool].get(metric_key)
+        lines = [f"\n{title} (relative to {base_tool}):"]
+        for tool, result in others:
+            tool_value = result.get(metric_key)
             if tool_value is None:
                 continue
 
             diff = tool_value - base_value
             diff_pct = (diff / base_value) * 100
 
+            # Float metrics (area, delay) have no "d" format.
+            diff_str = f"{diff:6d}" if isinstance(diff, int) else f"{diff:6.4g}"
             sign = "+" if diff > 0 else ""
-            print(f"  {tool:15s}: {sign}{diff:6d} ({sign}{diff_pct:+6.2f}%)")
+            lines.append(f"  {tool:15s}: {sign}{diff_str} ({sign}{diff_pct:+6.2f}%)")
+        print("\n".join(lines))
+
 
+def display_markdown(comparison, metric_filter=None, out=None):
+    """Display comparison as Markdown table with percentages.
 
-def display_markdown(comparison, metric_filter=None):
-    """Display comparison as Markdown table with percentages."""
+    Output goes to *out* (default: stdout).
+    """
 
-    tools = list(comparison.keys())
-    if not tools:
+    # The baseline is the first tool in insertion order; rows are sorted.
+    baseline_tool = next(iter(comparison), None)
+    if baseline_tool is None:
         return
 
     # Compact headers - show technology-specific metrics
@@ -1903,53 +2210,41 @@ def display_markdown(comparison, metric_filter=None):
     ]
     rows = []
 
-    # Get baseline (first tool)
-    baseline_tool = tools[0]
-    baseline_result = comparison.get(baseline_tool, {})
-    baseline_gates = baseline_result.get("gates", 0)
-    baseline_depth = baseline_result.get("depth", 0)
-    baseline_area_asap7 = baseline_result.get("area_asap7", 0)
-    baseline_delay_asap7 = baseline_result.get("delay_asap7", 0)
-    baseline_area_sky130 = baseline_result.get("area_sky130", 0)
-    baseline_delay_sky130 = baseline_result.get("delay_sky130", 0)
-
-    for tool in sorted(comparison.keys()):
-        result = comparison[tool]
-
-        # Helper to format value with percentage
-        def fmt(value, baseline):
-            if value is None or value == "N/A":
-                return "-"
-            if not baseline or tool == baseline_tool:
-                return str(value)
-            diff = value - baseline
-            diff_pct = (diff / baseline * 100) if baseline > 0 else 0
-            if diff > 0:
-                return f"{value} (+{diff_pct:.1f}%)"
-            elif diff < 0:
-                return f"**{value}** ({diff_pct:.1f}%)"
-            else:
-                return str(value)
-
-        row = [
-            tool,
-            fmt(result.get("gates"), baseline_gates),
-            fmt(result.get("depth"), baseline_depth),
-            fmt(result.get("area_asap7"), baseline_area_asap7),
-            fmt(result.get("delay_asap7"), baseline_delay_asap7),
-            fmt(result.get("area_sky130"), baseline_area_sky130),
-            fmt(result.get("delay_sky130"), baseline_delay_sky130),
-        ]
+    baseline_result = comparison[baseline_tool]
+    baselines = [baseline_result.get(key, 0) for key in _METRIC_KEYS]
+
+    for tool, result in sorted(comparison.items()):
+        # Pick the cell formatter once per row rather than per cell
+        cell = _md_value_cell if tool == baseline_tool else _md_display_cell
+
+        # Format each value with its percentage
+        row = [tool]
+        for key, baseline in zip(_METRIC_KEYS, baselines):
+            row.append(cell(result.get(key), baseline))
         rows.append(row)
 
     # Display table using tabulate's markdown format
-    print(tabulate(rows, headers=headers, tablefmt="github"))
+    print(_tabulate(rows, headers=headers, **_MD_TEXT_TABLE), file=out)
+
+
+# Result columns of the display_html table, after the tool name.
+_DISPLAY_HTML_COLUMNS = ("gates", "inputs", "outputs") + _METRIC_KEYS[1:]
+_DISPLAY_HTML_ROW = (
+    "\n        <tr>\n            <td>{tool}</td>\n"
+    + "".join(f"            <td>{{{key}}}</td>\n" for key in _DISPLAY_HTML_COLUMNS)
+    + "        </tr>\n"
+)
+
 
+def display_html(comparison, benchmark_name, metric_filter=None, out=None):
+    """Display comparison as HTML.
 
-def display_html(comparison, benchmark_name, metric_filter=None):
-    """Display comparison as HTML."""
+    Output goes to *out* (default: stdout).
+    """
 
-    html = f"""
+    benchmark_name = escape(benchmark_name)
+    parts = [
+        f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -1979,29 +2274,22 @@ def display_html(comparison, benchmark_name, metric_filter=None):
             <th>Delay (Sky130)</th>
         </tr>
 """
+    ]
 
     for tool, result in sorted(comparison.items()):
-        html += f"""
-        <tr>
-            <td>{tool}</td>
-            <td>{result.get("gates", "N/A")}</td>
-            <td>{result.get("inputs", "N/A")}</td>
-            <td>{result.get("outputs", "N/A")}</td>
-            <td>{result.get("depth", "N/A")}</td>
-            <td>{result.get("area_asap7", "N/A")}</td>
-            <td>{result.get("delay_asap7", "N/A")}</td>
-            <td>{result.get("area_sky130", "N/A")}</td>
-            <td>{result.get("delay_sky130", "N/A")}</td>
-        </tr>
-"""
+        values = {key: result.get(key, "N/A") for key in _DISPLAY_HTML_COLUMNS}
+        values["inputs"] = _get_with_fallback(result, "inputs", "num_inputs")
+        values["outputs"] = _get_with_fallback(result, "outputs", "num_outputs")
+        values["tool"] = _escape_name(tool)
+        parts.append(_DISPLAY_HTML_ROW.format_map(values))
 
-    html += """
+    parts.append("""
     </table>
 </body>
 </html>
-"""
+""")
 
-    print(html)
+    print("".join(parts), file=out)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+"""Shared JSON load/dump helpers for analysis inputs and outputs.
+
+Uses ``orjson`` when it is importable and falls back to the standard library
+``json`` module otherwise, so the faster parser is an opt-in install.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# With orjson, files at least this large are parsed straight from a read-only
+# memory map instead of first being copied into a bytes object.
+MMAP_THRESHOLD = 1 << 20
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from *data*."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that stdlib json accepts;
+            # re-parse with json so both backends accept the same inputs.
+            pass
+    return json.loads(data)
+
+
+def load_json(path: str | Path) -> Any:
+    """Read and parse the JSON file at *path*."""
+    if orjson is None:
+        return loads(Path(path).read_bytes())
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                return json.loads(bytes(view))
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes.
+
+    Output is compact unless *indent* is set, in which case it is indented by
+    two spaces.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def dump_json(obj: Any, path: str | Path, *, indent: bool = False) -> None:
+    """Serialize *obj* and write it to *path*."""
+    Path(path).write_bytes(dumps(obj, indent=indent))
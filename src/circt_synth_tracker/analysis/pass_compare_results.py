@@ -4,22 +4,17 @@
 from __future__ import annotations
 
 import argparse
-import json
 import math
 from html import escape
 from pathlib import Path
 
+from circt_synth_tracker.analysis.json_io import load_json
 from circt_synth_tracker.analysis.report_formatting import (
     format_metric_cell_html,
     format_ratio_with_pct,
 )
 
 
-def load_json(path: Path) -> dict:
-    with path.open() as f:
-        return json.load(f)
-
-
 def geomean(values: list[float]) -> float | None:
     vals = [v for v in values if v > 0]
     if not vals:
@@ -8,6 +8,8 @@ import json
 import sys
 from pathlib import Path
 
+from circt_synth_tracker.analysis.json_io import load_json
+
 METRICS = [
     ("lut_mapping_time", "LUT Mapping Time Ratio (CIRCT/ABC)"),
     ("sop_balancing_time", "SOP Balancing Time Ratio (CIRCT/ABC)"),
@@ -147,12 +149,11 @@ def main() -> int:
         print(f"Error: History file not found: {history_path}", file=sys.stderr)
         return 1
 
-    with history_path.open() as f:
-        history = json.load(f)
+    history = load_json(history_path)
 
     chart_data = build_chart_data(history)
     output_path = Path(args.output)
-    output_path.write_text(generate_html(history, chart_data))
+    output_path.write_bytes(generate_html(history, chart_data).encode("utf-8"))
     print(f"Pass time-series report generated: {output_path}")
     return 0
 
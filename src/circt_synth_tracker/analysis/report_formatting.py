@@ -35,6 +35,26 @@ def format_value_with_pct(
     return f"{value:.{value_digits}f} ({pct:+.1f}%)"
 
 
+# Style attributes for the 51 background shades, indexed by level - 150
+# where the colour's non-saturated channels are at *level* (150 to 200).
+_BETTER_STYLES = tuple(
+    f" style='background-color: rgb({level},255,{level});'" for level in range(150, 201)
+)
+_WORSE_STYLES = tuple(
+    f" style='background-color: rgb(255,{level},{level});'" for level in range(150, 201)
+)
+
+
+def background_style(is_better: bool, intensity: float) -> str:
+    """Return the green (better) or red (worse) style attribute for a cell.
+
+    *intensity* in [0, 1] maps onto 51 integer shades, whose attribute
+    strings are built once at import and looked up by index.
+    """
+    styles = _BETTER_STYLES if is_better else _WORSE_STYLES
+    return styles[int(200 - (50 * intensity)) - 150]
+
+
 def format_metric_cell_html(
     value: Any,
     baseline: Any,
@@ -75,10 +95,4 @@ def format_metric_cell_html(
         return content, ""
 
     intensity = min(abs_pct / intensity_cap_pct, 1.0)
-    if is_better:
-        green_val = int(200 - (50 * intensity))
-        bg_color = f"rgb({green_val},255,{green_val})"
-    else:
-        red_val = int(200 - (50 * intensity))
-        bg_color = f"rgb(255,{red_val},{red_val})"
-    return content, f" style='background-color: {bg_color};'"
+    return content, background_style(is_better, intensity)
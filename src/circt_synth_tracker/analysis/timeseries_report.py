@@ -13,6 +13,8 @@ import sys
 from math import exp, log
 from pathlib import Path
 
+from circt_synth_tracker.analysis.append_history import load_history
+
 METRICS = [
     ("gates", "Gates"),
     ("depth", "Depth"),
@@ -47,82 +49,54 @@ def build_chart_data(history):
     circt_versions = [e.get("circt_version", "unknown") for e in history]
     yosys_versions = [e.get("yosys_version", "unknown") for e in history]
 
+    # Each entry's per-tool benchmark maps, looked up once rather than for
+    # every benchmark and metric below
+    circt_bms = [entry.get("circt", {}).get("benchmarks", {}) for entry in history]
+    yosys_bms = [entry.get("yosys", {}).get("benchmarks", {}) for entry in history]
+
     # Collect all benchmark names across all history entries
     all_benchmarks = set()
-    for entry in history:
-        all_benchmarks.update(entry.get("circt", {}).get("benchmarks", {}).keys())
-        all_benchmarks.update(entry.get("yosys", {}).get("benchmarks", {}).keys())
+    for cbms, ybms in zip(circt_bms, yosys_bms):
+        all_benchmarks.update(cbms.keys())
+        all_benchmarks.update(ybms.keys())
     all_benchmarks = sorted(all_benchmarks)
 
     # Overview: geo-mean across all benchmarks per metric
     overview = {}
     for metric_key, _ in METRICS:
-        circt_geo = []
-        yosys_geo = []
-        for entry in history:
-            circt_vals = [
-                b.get(metric_key)
-                for b in entry.get("circt", {}).get("benchmarks", {}).values()
-            ]
-            yosys_vals = [
-                b.get(metric_key)
-                for b in entry.get("yosys", {}).get("benchmarks", {}).values()
-            ]
-            circt_geo.append(geo_mean(circt_vals))
-            yosys_geo.append(geo_mean(yosys_vals))
+        circt_geo = [
+            geo_mean([b.get(metric_key) for b in cbms.values()]) for cbms in circt_bms
+        ]
+        yosys_geo = [
+            geo_mean([b.get(metric_key) for b in ybms.values()]) for ybms in yosys_bms
+        ]
         overview[metric_key] = {"circt": circt_geo, "yosys": yosys_geo}
 
-    # Per-benchmark absolute values per metric
+    # Per-benchmark absolute values per metric, and the % difference
+    # (CIRCT vs Yosys) over time computed from the same values
     benchmark_data = {}
+    benchmark_pct = {}
     for bname in all_benchmarks:
+        circt_results = [cbms.get(bname, {}) for cbms in circt_bms]
+        yosys_results = [ybms.get(bname, {}) for ybms in yosys_bms]
         bdata = {}
+        bpct = {}
         for metric_key, _ in METRICS:
-            circt_vals = []
-            yosys_vals = []
-            for entry in history:
-                cb = entry.get("circt", {}).get("benchmarks", {}).get(bname, {})
-                yb = entry.get("yosys", {}).get("benchmarks", {}).get(bname, {})
-                circt_vals.append(cb.get(metric_key))
-                yosys_vals.append(yb.get(metric_key))
+            circt_vals = [cb.get(metric_key) for cb in circt_results]
+            yosys_vals = [yb.get(metric_key) for yb in yosys_results]
             bdata[metric_key] = {"circt": circt_vals, "yosys": yosys_vals}
+            bpct[metric_key] = [
+                round((cv - yv) / yv * 100, 2) if cv and yv and yv > 0 else None
+                for cv, yv in zip(circt_vals, yosys_vals)
+            ]
         benchmark_data[bname] = bdata
-
-    # Per-benchmark % difference (CIRCT vs Yosys) over time
-    benchmark_pct = {}
-    for bname in all_benchmarks:
-        bpct = {}
-        for metric_key, _ in METRICS:
-            pcts = []
-            for entry in history:
-                cv = (
-                    entry.get("circt", {})
-                    .get("benchmarks", {})
-                    .get(bname, {})
-                    .get(metric_key)
-                )
-                yv = (
-                    entry.get("yosys", {})
-                    .get("benchmarks", {})
-                    .get(bname, {})
-                    .get(metric_key)
-                )
-                if cv and yv and yv > 0:
-                    pcts.append(round((cv - yv) / yv * 100, 2))
-                else:
-                    pcts.append(None)
-            bpct[metric_key] = pcts
         benchmark_pct[bname] = bpct
 
     # Category per benchmark (take from most recent entry that has it)
     benchmark_categories = {}
     for bname in all_benchmarks:
-        for entry in reversed(history):
-            cat = (
-                entry.get("circt", {})
-                .get("benchmarks", {})
-                .get(bname, {})
-                .get("category")
-            )
+        for cbms in reversed(circt_bms):
+            cat = cbms.get(bname, {}).get("category")
             if cat:
                 benchmark_categories[bname] = cat
                 break
@@ -567,7 +541,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Generate interactive time series HTML report from synthesis history"
     )
-    parser.add_argument("history", help="History JSON file")
+    parser.add_argument("history", help="History JSON or NDJSON file")
     parser.add_argument(
         "-o",
         "--output",
@@ -585,8 +559,7 @@ def main():
         print(f"Error: History file not found: {history_path}", file=sys.stderr)
         return 1
 
-    with open(history_path) as f:
-        history = json.load(f)
+    history = load_history(history_path)
 
     if not history:
         print("Error: history is empty", file=sys.stderr)
@@ -598,9 +571,10 @@ def main():
     chart_data = build_chart_data(history)
     html = generate_html(history, chart_data)
 
+    # Write the page as one UTF-8 encoded block, bypassing the text layer
+    # and the locale's default encoding
     output_path = Path(args.output)
-    with open(output_path, "w") as f:
-        f.write(html)
+    output_path.write_bytes(html.encode("utf-8"))
 
     print(f"Time series report generated: {output_path} ({len(history)} data points)")
     return 0
@@ -0,0 +1,161 @@
+"""
+Shared lit configuration for circt-synth-tracker benchmarks.
+
+``benchmarks/lit.cfg.py`` is a thin shim around :func:`configure`. Keeping the
+logic in an importable module means it is compiled once and cached in
+``__pycache__`` instead of being re-parsed every time lit executes the config.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+import lit.formats
+
+from circt_synth_tracker.tool_registry import get_registry
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_command(name):
+    """Return the command for tool *name*, memoized for the lit process."""
+    return get_registry().get_tool(name).get_command()
+
+
+def _tool_settings(lit_config, path):
+    """Compute the environment and substitutions shared by every suite."""
+    # Get tool paths from registry (which reads from environment)
+    circt_synth = _tool_command("circt-synth")
+    circt_verilog = _tool_command("circt-verilog")
+    circt_translate = _tool_command("circt-translate")
+    circt_lec = _tool_command("circt-lec")
+    yosys = _tool_command("yosys")
+    abc = _tool_command("abc")
+    filecheck = _tool_command("FileCheck")
+
+    # Build tool wrapper commands
+    circt_synth_extra_args = lit_config.params.get("CIRCT_SYNTH_EXTRA_ARGS", "")
+    abc_commands = lit_config.params.get("ABC_COMMANDS", "")
+    run_lec = lit_config.params.get("RUN_LEC", "")
+    tv_solver = lit_config.params.get("TV_SOLVER", "")
+    keep_tv_artifacts = lit_config.params.get("KEEP_TV_ARTIFACTS", "")
+
+    circt_synth_wrapper = f"run-circt-synth --circt-synth {circt_synth} --circt-verilog {circt_verilog} --circt-translate {circt_translate} --circt-lec {circt_lec}"
+    if circt_synth_extra_args:
+        circt_synth_wrapper += f' --circt-synth-extra-args="{circt_synth_extra_args}"'
+    if run_lec:
+        circt_synth_wrapper += " --run-lec"
+    if tv_solver:
+        circt_synth_wrapper += " --run-tv"
+        circt_synth_wrapper += f' --tv-solver="{tv_solver}"'
+
+    if keep_tv_artifacts:
+        circt_synth_wrapper += " --keep-tv-artifacts"
+
+    yosys_wrapper = f"run-yosys --yosys {yosys}"
+
+    # AIG optimization layer (between synthesis and judging)
+    aig_tool_cmd = f"run-abc-opt --abc {abc}"
+    if abc_commands:
+        aig_tool_cmd += f' --abc-commands="{abc_commands}"'
+
+    # Tool selection (configurable via --param SYNTH_TOOL=<tool>, default: circt)
+    tool_name = lit_config.params.get("SYNTH_TOOL", "circt")
+
+    # Select the appropriate tool based on SYNTH_TOOL parameter
+    if tool_name == "yosys":
+        tool_cmd = yosys_wrapper
+    else:  # default to circt
+        tool_cmd = circt_synth_wrapper
+
+    # Select Technology Mapper
+    tech_map = lit_config.params.get("TECH_MAP", "mockturtle")
+    if tech_map == "abc":
+        tech_map_command = "abc-aig-judge"
+    else:
+        tech_map_command = "mockturtle-aig-judge"
+
+    # Bitwidth parameter (configurable via --param BW=<width>, default: 16)
+    bw = lit_config.params.get("BW", "16")
+
+    # Results directory (configurable via --param RESULTS_DIR=<dir>)
+    results_dir = lit_config.params.get("RESULTS_DIR", "")
+    submit_cmd = f"submit-results --tool {tool_name}-{tech_map} --bw {bw}"
+    if results_dir:
+        submit_cmd = f"submit-results --output-dir {results_dir} --bw {bw}"
+
+    environment = {"SYNTH_TOOL": tool_name, "TECH_MAP": tech_map}
+
+    # Substitutions (order matters - more specific patterns first)
+    substitutions = [
+        ("%SYNTH_TOOL", tool_cmd),
+        ("%AIG_TOOL", aig_tool_cmd),
+        ("%FileCheck", filecheck),
+        ("%judge", tech_map_command),
+        ("%submit", submit_cmd),
+        ("%BW", bw),
+        ("%PATH%", path),
+    ]
+    return environment, substitutions
+
+
+def configure(config, lit_config, source_root):
+    """Configure the top-level benchmark suite rooted at *source_root*."""
+    source_root = Path(source_root)
+    project_root = source_root.parent
+
+    # name: The name of this test suite.
+    config.name = "Benchmarks"
+
+    # testFormat: The test format to use to interpret tests.
+    config.test_format = lit.formats.ShTest(True)
+
+    # suffixes: A list of file extensions to treat as test files.
+    config.suffixes = [".mlir", ".test", ".ll", ".sv", ".v"]
+
+    # test_source_root: The root path where tests are located.
+    config.test_source_root = str(source_root)
+
+    # test_exec_root: The root path where tests should be run.
+    # Configurable via --param TEST_OUTPUT_DIR=<dir>, default: build/
+    test_output_dir = lit_config.params.get("TEST_OUTPUT_DIR", "build")
+    config.test_exec_root = os.path.join(project_root, test_output_dir)
+
+    # Store for child configs to inherit
+    config.test_output_dir = test_output_dir
+    config.benchmarks_root = str(source_root)
+
+    # Child suites re-run lit.cfg.py through lit_config.load_config(). Compute
+    # the shared settings on the first load and reuse them for the rest of
+    # the run.
+    settings = getattr(lit_config, "circt_synth_tracker_settings", None)
+    if settings is None:
+        # Ensure output directory exists
+        os.makedirs(config.test_exec_root, exist_ok=True)
+        settings = _tool_settings(lit_config, config.environment["PATH"])
+        lit_config.circt_synth_tracker_settings = settings
+
+    environment, substitutions = settings
+    config.environment.update(environment)
+    config.substitutions.extend(substitutions)
+
+
+def suite_exec_root(config, lit_config, suite_dir, per_bw=True):
+    """Return the exec root for the child suite in *suite_dir*, creating it.
+
+    The suite's location under benchmarks/ is mirrored inside the output
+    directory inherited from the parent config, with a per-bitwidth
+    subdirectory when *per_bw* is set. Uses plain string path operations.
+    """
+    benchmarks_root = config.benchmarks_root
+    parts = [
+        os.path.dirname(benchmarks_root),
+        config.test_output_dir,
+        os.path.relpath(suite_dir, benchmarks_root),
+    ]
+    if per_bw:
+        parts.append(lit_config.params.get("BW", "16"))
+    exec_root = os.path.join(*parts)
+
+    # Ensure output directory exists
+    os.makedirs(exec_root, exist_ok=True)
+    return exec_root
@@ -15,6 +15,7 @@ import argparse
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -148,8 +149,6 @@ def run_tv(
 
     # Preserve failed MLIR pairs for debugging (only on non-equiv, not timeout)
     if failed_pairs:
-        import shutil
-
         tv_pair_dir = Path(str(output_file) + ".tv-pairs")
         tv_pair_dir.mkdir(parents=True, exist_ok=True)
         reproduce_lines = [
@@ -318,8 +317,6 @@ def main():
 
         if args.run_tv:
             if args.keep_tv_artifacts:
-                import shutil
-
                 tv_tree_dir = Path(str(output_file) + ".tv-ir-tree")
                 shutil.rmtree(tv_tree_dir, ignore_errors=True)
                 tv_tree_dir.mkdir(parents=True, exist_ok=True)
@@ -407,8 +404,6 @@ def main():
     finally:
         # Persist failing MLIR artifacts outside temporary dirs (e.g. lit TMPDIR).
         if sys.exc_info()[0] is not None:
-            import shutil
-
             failed_input_mlir = Path(str(output_file) + ".failed.input.mlir")
             failed_synth_mlir = Path(str(output_file) + ".failed.synth.mlir")
 
@@ -443,8 +438,6 @@ def main():
                     f"  TV: keeping per-pass IR tree at {tv_tree_dir}", file=sys.stderr
                 )
             else:
-                import shutil
-
                 shutil.rmtree(tv_tree_dir, ignore_errors=True)
 
     return 0
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from circt_synth_tracker.analysis.aggregate_results import (
+    _find_json_files,
+    _find_result_files,
+    _parse_results,
+    _write_summary,
+)
+
+
+def _write_result(path, name):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"benchmark": name, "metrics": {"gates": 1}}))
+    return path
+
+
+def test_find_json_files_matches_tool_pattern(tmp_path):
+    lut = _write_result(tmp_path / "a" / "results" / "circt-lut-pass" / "x.json", "x")
+    sop = _write_result(tmp_path / "results" / "circt-sop-pass" / "y.json", "y")
+    _write_result(tmp_path / "a" / "results" / "abc-lut-pass" / "z.json", "z")
+    _write_result(tmp_path / "a" / "circt-lut-pass" / "loose.json", "loose")
+
+    assert _find_json_files(tmp_path, "circt-*-pass") == [lut, sop]
+    assert _find_json_files(tmp_path, "circt-lut-pass") == [lut]
+
+
+def test_find_json_files_without_tool_returns_every_json(tmp_path):
+    files = [
+        _write_result(tmp_path / "results" / "yosys" / "a.json", "a"),
+        _write_result(tmp_path / "other" / "b.json", "b"),
+    ]
+    (tmp_path / "other" / "notes.txt").write_text("not json")
+
+    assert _find_json_files(tmp_path) == sorted(files)
+    assert _find_json_files(tmp_path, "circt") == []
+
+
+def test_find_json_files_missing_root_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        _find_json_files(tmp_path / "missing", "circt")
+
+
+def test_find_result_files_falls_back_to_every_json(tmp_path):
+    lut = _write_result(tmp_path / "results" / "circt-lut-pass" / "x.json", "x")
+    loose = _write_result(tmp_path / "loose.json", "loose")
+
+    assert _find_result_files(tmp_path, "circt-*") == ([lut], True)
+    assert _find_result_files(tmp_path, "yosys") == (sorted([lut, loose]), False)
+
+
+def test_parse_results_attributes_errors_to_their_file():
+    read_error = OSError("unreadable")
+    raw = [
+        (b'{"benchmark": "a"}', None),
+        (b"{not json", None),
+        (None, read_error),
+        (b'{"benchmark": "b"}, {"benchmark": "c"}', None),
+        (b'{"benchmark": "d"}', None),
+    ]
+
+    parsed = _parse_results(raw)
+
+    assert parsed[0] == ({"benchmark": "a"}, None)
+    assert parsed[1][0] is None and isinstance(parsed[1][1], ValueError)
+    assert parsed[2] == (None, read_error)
+    assert parsed[3][0] is None and isinstance(parsed[3][1], ValueError)
+    assert parsed[4] == ({"benchmark": "d"}, None)
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_write_summary_streams_valid_json(tmp_path, count):
+    output = tmp_path / "summary.json"
+    results = [(f"b{i}@lut", {"gates": i}) for i in range(count)]
+
+    assert _write_summary(output, {"tool": "circt"}, iter(results)) == count
+    assert json.loads(output.read_text()) == {
+        "tool": "circt",
+        "benchmarks": dict(results),
+        "total_benchmarks": count,
+    }
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_write_summary_pretty_matches_indented_dump(tmp_path, count):
+    output = tmp_path / "summary.json"
+    results = [(f"b{i}@lut", {"gates": i, "tags": []}) for i in range(count)]
+
+    assert (
+        _write_summary(output, {"tool": "circt"}, iter(results), pretty=True) == count
+    )
+    summary = {"tool": "circt", "benchmarks": dict(results), "total_benchmarks": count}
+    assert output.read_text() == json.dumps(summary, indent=2)
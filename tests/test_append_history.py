@@ -0,0 +1,108 @@
+import json
+import sys
+
+from circt_synth_tracker.analysis import append_history
+from circt_synth_tracker.analysis.append_history import load_history
+
+
+def _write_summary(path, version):
+    path.write_text(json.dumps({"version": version, "benchmarks": {"x": {"gates": 1}}}))
+    return path
+
+
+def _run(monkeypatch, tmp_path, output, date, version="v1", max_days=0):
+    circt = _write_summary(tmp_path / "circt.json", version)
+    yosys = _write_summary(tmp_path / "yosys.json", "y1")
+    argv = ["append-history", "--circt", str(circt), "--yosys", str(yosys)]
+    argv += ["-o", str(output), "--date", date, "--max-days", str(max_days)]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert append_history.main() == 0
+
+
+def test_ndjson_history_appends_and_replaces_same_date(monkeypatch, tmp_path):
+    output = tmp_path / "history.ndjson"
+    _run(monkeypatch, tmp_path, output, "2025-01-01")
+    _run(monkeypatch, tmp_path, output, "2025-01-02")
+    _run(monkeypatch, tmp_path, output, "2025-01-02", version="v2")
+
+    lines = output.read_text().splitlines()
+    assert len(lines) == 2
+    history = load_history(output)
+    assert [e["date"] for e in history] == ["2025-01-01", "2025-01-02"]
+    assert history[-1]["circt_version"] == "v2"
+
+
+def test_ndjson_history_rewrites_out_of_order_and_trimmed(monkeypatch, tmp_path):
+    output = tmp_path / "history.ndjson"
+    _run(monkeypatch, tmp_path, output, "2025-01-03")
+    _run(monkeypatch, tmp_path, output, "2025-01-01")
+    _run(monkeypatch, tmp_path, output, "2025-01-02", max_days=2)
+
+    dates = [e["date"] for e in load_history(output)]
+    assert dates == ["2025-01-02", "2025-01-03"]
+
+
+def test_json_history_matches_ndjson(monkeypatch, tmp_path):
+    for output in (tmp_path / "history.json", tmp_path / "history.ndjson"):
+        _run(monkeypatch, tmp_path, output, "2025-01-02")
+        _run(monkeypatch, tmp_path, output, "2025-01-01")
+    assert load_history(tmp_path / "history.json") == load_history(
+        tmp_path / "history.ndjson"
+    )
+
+
+def test_missing_summary_reports_error(monkeypatch, tmp_path, capsys):
+    yosys = _write_summary(tmp_path / "yosys.json", "y1")
+    argv = ["append-history", "--circt", str(tmp_path / "missing.json")]
+    argv += ["--yosys", str(yosys), "-o", str(tmp_path / "history.json")]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    assert append_history.main() == 1
+    assert "CIRCT summary not found" in capsys.readouterr().err
+    assert not (tmp_path / "history.json").exists()
+
+
+def test_unchanged_summary_reuses_previous_entry(monkeypatch, tmp_path):
+    output = tmp_path / "history.json"
+    _run(monkeypatch, tmp_path, output, "2025-01-01")
+    history = json.loads(output.read_text())
+    assert len(history[0]["circt_hash"]) == 32
+    # Payload taken from the previous entry, not re-parsed from the summary.
+    history[0]["circt"]["benchmarks"] = {"reused": {"gates": 2}}
+    output.write_text(json.dumps(history))
+
+    _run(monkeypatch, tmp_path, output, "2025-01-02")
+    _run(monkeypatch, tmp_path, output, "2025-01-03", version="v2")
+
+    latest = json.loads(output.read_text())
+    assert latest[1]["circt"]["benchmarks"] == {"reused": {"gates": 2}}
+    assert latest[1]["yosys"]["benchmarks"] == {"x": {"gates": 1}}
+    assert latest[2]["circt"]["benchmarks"] == {"x": {"gates": 1}}
+    assert latest[2]["circt_version"] == "v2"
+
+
+def test_malformed_summary_reports_error(monkeypatch, tmp_path, capsys):
+    circt = tmp_path / "circt.json"
+    circt.write_text(json.dumps({"version": "v1", "benchmarks": []}))
+    yosys = _write_summary(tmp_path / "yosys.json", "y1")
+    argv = ["append-history", "--circt", str(circt), "--yosys", str(yosys)]
+    argv += ["-o", str(tmp_path / "history.json")]
+    monkeypatch.setattr(sys, "argv", argv)
+
+    assert append_history.main() == 1
+    assert "CIRCT summary benchmarks" in capsys.readouterr().err
+
+
+def test_rerun_with_unchanged_summaries_leaves_history_untouched(
+    monkeypatch, tmp_path, capsys
+):
+    for output in (tmp_path / "history.json", tmp_path / "history.ndjson"):
+        _run(monkeypatch, tmp_path, output, "2025-01-01")
+        capsys.readouterr()
+
+        with monkeypatch.context() as m:
+            m.setattr(append_history, "dump_json", None)
+            m.setattr(append_history, "_append_ndjson", None)
+            _run(monkeypatch, tmp_path, output, "2025-01-01")
+
+        assert "History unchanged: 1 entries" in capsys.readouterr().out
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from circt_synth_tracker.analysis import check_cec
+from circt_synth_tracker.analysis.check_cec import _run_one_cec
+
+
+@pytest.mark.parametrize(
+    "text, status",
+    [
+        ("Networks are equivalent.", "equiv"),
+        ("Networks are NOT EQUIVALENT.", "non-equiv"),
+        ("Miter is Not Equivalent", "non-equiv"),
+        ("bad \xff input", "error"),
+    ],
+)
+def test_run_one_cec_classifies_abc_output(tmp_path, text, status):
+    abc = tmp_path / "abc"
+    (tmp_path / "out.txt").write_bytes(text.encode("latin-1"))
+    abc.write_text(f"#!/bin/sh\ncat {tmp_path / 'out.txt'}\n")
+    abc.chmod(0o755)
+
+    name, got, _, output = _run_one_cec(str(abc), "add", "a", "b")
+
+    assert (name, got) == ("add", status)
+    assert isinstance(output, str)
+
+
+def test_run_one_cec_timeout_kills_abc_children(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_cec, "_ABC_TIMEOUT", 0.5)
+    abc = tmp_path / "abc"
+    # The background child inherits stdout and would keep the pipe open.
+    abc.write_text("#!/bin/sh\nsleep 30 &\nwait\n")
+    abc.chmod(0o755)
+
+    start = time.monotonic()
+    result = _run_one_cec(str(abc), "add", "a", "b")
+
+    assert result == ("add", "timeout", "timeout", "")
+    assert time.monotonic() - start < 10
+
+
+def test_run_one_cec_finds_verdict_after_long_transcript(tmp_path):
+    abc = tmp_path / "abc"
+    (tmp_path / "out.txt").write_text("stats\n" * 10000 + "Networks are equivalent.\n")
+    abc.write_text(f"#!/bin/sh\ncat {tmp_path / 'out.txt'}\necho warning >&2\n")
+    abc.chmod(0o755)
+
+    assert _run_one_cec(str(abc), "add", "a", "b")[1] == "equiv"
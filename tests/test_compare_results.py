@@ -0,0 +1,252 @@
+import json
+
+import pytest
+
+from circt_synth_tracker.analysis import compare_results, json_io
+from circt_synth_tracker.analysis.compare_results import (
+    _build_index,
+    _category_log_columns,
+    _geo_mean_of_logs,
+    _group_by_category,
+    _log_columns,
+    _render_github_md,
+    _same_metric_values,
+    build_comparisons,
+    generate_json_report,
+    generate_markdown_report,
+)
+
+
+def test_build_index_takes_category_from_first_tool():
+    summaries = {
+        "circt": {"benchmarks": {"add": {"gates": 1, "category": "Arith"}}},
+        "yosys": {
+            "benchmarks": {
+                "add": {"gates": 2, "category": "Other"},
+                "mul": {"gates": 3},
+            }
+        },
+    }
+
+    index = _build_index(summaries)
+
+    assert index["add"]["category"] == "Arith"
+    assert list(index["add"]["by_tool"]) == ["circt", "yosys"]
+    assert index["mul"] == {"category": "Other", "by_tool": {"yosys": {"gates": 3}}}
+
+
+def test_group_by_category_sorts_categories_and_names():
+    index = {
+        "b": {"category": "Z", "by_tool": {}},
+        "c": {"category": "A", "by_tool": {}},
+        "a": {"category": "Z", "by_tool": {}},
+    }
+
+    grouped = _group_by_category(index)
+
+    assert list(grouped) == ["A", "Z"]
+    assert grouped == {"A": ("c",), "Z": ("a", "b")}
+
+
+def test_build_comparisons_keeps_benchmarks_with_two_results():
+    index = {
+        "b": {"category": "A", "by_tool": {"circt": {"gates": 1}, "yosys": {}}},
+        "c": {"category": "A", "by_tool": {"circt": {"gates": 1}}},
+        "a": {
+            "category": "A",
+            "by_tool": {"circt": {"gates": 1}, "yosys": {"gates": 2}},
+        },
+    }
+
+    assert build_comparisons(index) == {
+        "a": {"circt": {"gates": 1}, "yosys": {"gates": 2}}
+    }
+
+
+def test_geo_mean_of_log_columns_skips_non_positive_values():
+    benchmarks = {
+        "a": {"gates": 2, "depth": 0},
+        "b": {"gates": 8},
+        "c": {"gates": None, "depth": -1},
+    }
+
+    columns = _log_columns(benchmarks, ["gates", "depth"])
+
+    assert set(columns["gates"]) == {"a", "b"}
+    assert columns["depth"] == {}
+    assert _geo_mean_of_logs(list(columns["gates"].values())) == pytest.approx(4.0)
+    assert _geo_mean_of_logs([]) is None
+    assert _geo_mean_of_logs(None) is None
+
+
+def test_category_log_columns_splits_by_category():
+    columns = {"gates": {"a": 1.0, "b": 2.0, "c": 3.0, "x": 4.0}, "depth": {}}
+
+    category_of = compare_results._category_of({"A": ("a", "c"), "B": ("b",)})
+    split = _category_log_columns(columns, category_of)
+
+    assert split == {"gates": {"A": [1.0, 3.0], "B": [2.0]}, "depth": {}}
+
+
+def test_render_github_md_renders_unpadded_table():
+    table = _render_github_md(["", "From", "To"], [["✔", "a", 1]])
+
+    assert table == "|  | From | To |\n|---|---|---|\n| ✔ | a | 1 |"
+    assert _render_github_md(["Tool"], []) == "| Tool |\n|---|"
+
+
+@pytest.mark.parametrize("with_shared", [True, False])
+def test_generate_json_report_matches_whole_report_dump(tmp_path, with_shared):
+    summaries = {
+        "circt": {"timestamp": "t0", "benchmarks": {"only": {"gates": 1}}},
+        "yosys": {"benchmarks": {}},
+    }
+    if with_shared:
+        summaries["circt"]["benchmarks"]["add"] = {"gates": 2, "name": "aé"}
+        summaries["yosys"]["benchmarks"]["add"] = {"gates": 3, "tags": []}
+    index = _build_index(summaries)
+    output = tmp_path / "report.json"
+
+    generate_json_report(summaries, index, output)
+
+    benchmarks = {"add": index["add"]["by_tool"]} if with_shared else {}
+    expected = {
+        "metadata": {
+            "tools_compared": ["circt", "yosys"],
+            "total_benchmarks": len(index),
+            "generated": "t0",
+        },
+        "benchmarks": benchmarks,
+    }
+    assert output.read_bytes() == json_io.dumps(expected, indent=True)
+
+
+def test_main_reuses_cached_html_report(tmp_path, monkeypatch, capsys):
+    for tool, gates in [("circt", 1), ("yosys", 2)]:
+        (tmp_path / f"{tool}.json").write_text(
+            json.dumps({"tool": tool, "benchmarks": {"add": {"gates": gates}}})
+        )
+    report = tmp_path / "report.html"
+    argv = [
+        "compare-results",
+        str(tmp_path / "circt.json"),
+        str(tmp_path / "yosys.json"),
+        "-o",
+        str(report),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    monkeypatch.setattr("sys.argv", argv)
+
+    assert compare_results.main() == 0
+    first = report.read_text()
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    report.unlink()
+    assert compare_results.main() == 0
+    assert "reused from cache" in capsys.readouterr().out
+    assert report.read_text() == first
+
+
+def test_compare_metric_cell_cache_keeps_int_and_float_apart():
+    int_cell = compare_results._compare_metric_cell(3, 2)
+    float_cell = compare_results._compare_metric_cell(3.0, 2)
+
+    assert int_cell[0].startswith("3<br>")
+    assert float_cell[0].startswith("3.0<br>")
+    assert compare_results._compare_metric_cell("N/A", 2) == ("N/A", "")
+
+
+def test_same_metric_values_requires_matching_types():
+    assert _same_metric_values([3, None, 1.5], [3, None, 1.5])
+    assert not _same_metric_values([3, None], [3.0, None])
+    assert not _same_metric_values([3, 2], [3, 1])
+
+
+def test_md_report_cell_cache_handles_types_and_unhashable_values():
+    assert compare_results._md_report_cell(3, 2) == "3 (+50.0%)"
+    assert compare_results._md_report_cell(3.0, 2) == "3.0 (+50.0%)"
+    assert compare_results._md_report_cell([1], 0) == "[1]"
+
+
+def test_get_with_fallback_keeps_zero_counts():
+    get = compare_results._get_with_fallback
+
+    assert get({"inputs": 0, "num_inputs": 4}, "inputs", "num_inputs") == 0
+    assert get({"inputs": None, "num_inputs": 4}, "inputs", "num_inputs") == 4
+    assert get({}, "inputs", "num_inputs") == "N/A"
+
+
+def test_markdown_report_is_identical_with_worker_processes(tmp_path, monkeypatch):
+    summaries = {
+        tool: {
+            "benchmarks": {
+                f"b{i}": {"gates": i + offset, "category": f"c{i % 2}"}
+                for i in range(4)
+            }
+        }
+        for tool, offset in [("circt", 1), ("yosys", 2)]
+    }
+    index = _build_index(summaries)
+    serial, parallel = tmp_path / "serial.md", tmp_path / "parallel.md"
+
+    generate_markdown_report(summaries, index, serial, {"b1": "equiv"}, jobs=1)
+    monkeypatch.setattr(compare_results, "_MD_PARALLEL_MIN_BENCHMARKS", 1)
+    generate_markdown_report(summaries, index, parallel, {"b1": "equiv"}, jobs=2)
+
+    assert parallel.read_text() == serial.read_text()
+    assert "**b1** (CEC: ✔)" in serial.read_text()
+
+
+def test_paired_metric_values_skips_benchmarks_missing_a_tool():
+    summaries = {
+        "circt": {"benchmarks": {"a": {"gates": 1}, "b": {"gates": 2}, "c": {}}},
+        "yosys": {"benchmarks": {"a": {"gates": 3, "depth": 4}, "c": {"gates": 5}}},
+    }
+
+    pairs = compare_results._paired_metric_values(
+        summaries, ["X"], {"X": ["a", "b", "c"]}, ["circt", "yosys"]
+    )
+
+    none = (None,) * 4
+    assert pairs == [("a", "X", (1, None, *none), (3, 4, *none), (200.0, None, *none))]
+
+
+def test_load_summary_reports_errors_instead_of_raising(tmp_path):
+    good = tmp_path / "circt-summary.json"
+    good.write_text('{"benchmarks": {}}')
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+
+    assert compare_results._load_summary(good) == (
+        "circt-summary",
+        {"benchmarks": {}},
+        None,
+    )
+    missing = compare_results._load_summary(tmp_path / "missing.json")
+    assert missing[2] == f"Error: File not found: {tmp_path / 'missing.json'}"
+    assert compare_results._load_summary(bad)[2].startswith(f"Error loading {bad}:")
+
+
+def test_geomean_cell_html_colors_only_real_differences():
+    cell = compare_results._geomean_cell_html
+
+    assert cell(5.0, 0) == ("5.0", "")
+    assert cell(4.0, 4.0) == ("4.0 <span class='diff'>(+0.0%)</span>", "")
+    content, style = cell(3.0, 4.0)
+    assert content == "3.0 <span class='diff'>(-25.0%)</span>"
+    assert style.startswith(" style=")
+
+
+def test_html_report_escapes_tool_and_category_names(tmp_path):
+    summaries = {
+        tool: {"benchmarks": {"add": {"gates": gates, "category": "A&B"}}}
+        for tool, gates in [("circt<1>", 1), ("yosys", 2)]
+    }
+    output = tmp_path / "report.html"
+
+    compare_results.generate_html_report(summaries, _build_index(summaries), output)
+
+    html = output.read_text()
+    assert "📁 A&amp;B</td>" in html
+    assert ">circt&lt;1&gt;</th>" in html
@@ -0,0 +1,23 @@
+import math
+
+import pytest
+
+from circt_synth_tracker.analysis import json_io
+
+
+@pytest.mark.parametrize("threshold", [1, 1 << 20])
+def test_load_json_matches_with_and_without_mmap(tmp_path, monkeypatch, threshold):
+    monkeypatch.setattr(json_io, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / "summary.json"
+    path.write_text('{"benchmarks": {"add": {"gates": 3}}}')
+
+    assert json_io.load_json(path) == {"benchmarks": {"add": {"gates": 3}}}
+
+
+@pytest.mark.parametrize("threshold", [1, 1 << 20])
+def test_load_json_accepts_nan(tmp_path, monkeypatch, threshold):
+    monkeypatch.setattr(json_io, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / "summary.json"
+    path.write_text('{"delay": NaN}')
+
+    assert math.isnan(json_io.load_json(path)["delay"])
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from circt_synth_tracker import lit_common
+
+
+def _config():
+    return SimpleNamespace(environment={"PATH": "/usr/bin"}, substitutions=[])
+
+
+def test_configure_reuses_settings_for_child_suites(tmp_path, monkeypatch):
+    lit_config = SimpleNamespace(
+        params={"TEST_OUTPUT_DIR": "out", "SYNTH_TOOL": "yosys", "BW": "8"}
+    )
+    calls = []
+    original = lit_common._tool_settings
+
+    def counting_settings(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(lit_common, "_tool_settings", counting_settings)
+    # The test format depends on the installed lit version and is not under test.
+    monkeypatch.setattr(lit_common.lit.formats, "ShTest", lambda *args: None)
+    top, child = _config(), _config()
+    lit_common.configure(top, lit_config, tmp_path / "benchmarks")
+    lit_common.configure(child, lit_config, tmp_path / "benchmarks")
+
+    assert len(calls) == 1
+    assert (tmp_path / "out").is_dir()
+    assert child.test_output_dir == "out"
+    assert child.environment["SYNTH_TOOL"] == "yosys"
+    assert child.substitutions == top.substitutions
+    assert ("%BW", "8") in child.substitutions
+    assert dict(child.substitutions)["%SYNTH_TOOL"].startswith("run-yosys")
+
+
+def test_suite_exec_root_mirrors_suite_path(tmp_path):
+    benchmarks = tmp_path / "benchmarks"
+    config = SimpleNamespace(benchmarks_root=str(benchmarks), test_output_dir="out")
+    lit_config = SimpleNamespace(params={"BW": "8"})
+
+    exec_root = lit_common.suite_exec_root(
+        config, lit_config, str(benchmarks / "comb" / "ELAU")
+    )
+    pass_root = lit_common.suite_exec_root(
+        config, lit_config, str(benchmarks / "pass"), per_bw=False
+    )
+
+    assert exec_root == str(tmp_path / "out" / "comb" / "ELAU" / "8")
+    assert pass_root == str(tmp_path / "out" / "pass")
+    assert (tmp_path / "out" / "comb" / "ELAU" / "8").is_dir()